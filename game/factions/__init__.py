@@ -64,6 +64,20 @@ class FactionDiplomacy:
         self._relations[key] = updated
         return updated
 
+    def adjust_standing_many(self, faction: str, others: Iterable[str], delta: float) -> None:
+        """Apply the same ``delta`` to the standing of ``faction`` with each of ``others``."""
+
+        relations = self._relations
+        neutral = self.neutral_value
+        low = self.min_value
+        high = self.max_value
+        delta = float(delta)
+        for other in others:
+            if other == faction:
+                continue
+            key = (faction, other) if faction < other else (other, faction)
+            relations[key] = max(low, min(high, relations.get(key, neutral) + delta))
+
     def decay(self) -> None:
         """Drift all standings towards neutral."""
 
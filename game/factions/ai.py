@@ -12,6 +12,7 @@ deterministic relative to the world seed.
 from __future__ import annotations
 
 import math
+import sys
 from collections.abc import Hashable, Iterable, Mapping, Sequence
 from typing import TypedDict, cast
 
@@ -703,8 +704,10 @@ class FactionAIController:
             # 5% chance per day to issue a mission
             if float(self._mission_rng.random()) < 0.05:
                 # For now we only implement a single escort mission type
+                # Interned so the UI's per-turn name comparisons short-circuit
+                # on identity instead of comparing characters.
                 mission = {
-                    "faction": faction.name,
+                    "faction": sys.intern(faction.name),
                     "type": "escort_caravan",
                     "description": f"Escort a {faction.name} caravan safely between sites.",
                     # Reward is proportional to the faction's wealth preference; default 10
@@ -1046,7 +1049,7 @@ class FactionAIController:
                     payload = {"demand": amount, "reward": 0.0}
             negotiations.append(
                 {
-                    "faction": faction.name,
+                    "faction": sys.intern(faction.name),
                     "type": n_type,
                     "description": desc,
                     "expires": day + 5,
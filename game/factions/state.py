@@ -79,6 +79,8 @@ class FactionLedger:
 
     def __init__(self) -> None:
         self._factions = pl.DataFrame(schema=_FACTION_SCHEMA)
+        # Bumped whenever a faction row is added so callers can cache the roster.
+        self._revision = 0
         self._known_sites = pl.DataFrame(schema=_KNOWN_SITE_SCHEMA)
         self._resources = pl.DataFrame(schema=_RESOURCE_SCHEMA)
         self._preferences = pl.DataFrame(schema=_PREFERENCE_SCHEMA)
@@ -294,6 +296,7 @@ class FactionLedger:
     def clone(self) -> FactionLedger:
         other = FactionLedger()
         other._factions = self._factions.clone()
+        other._revision = self._revision
         other._known_sites = self._known_sites.clone()
         other._resources = self._resources.clone()
         other._preferences = self._preferences.clone()
@@ -318,6 +321,7 @@ class FactionLedger:
             self._factions = self._factions.vstack(
                 pl.DataFrame([{"name": name}], schema=_FACTION_SCHEMA)
             )
+            self._revision += 1
         # Make sure reputation entry exists for this faction
         if self._reputations.filter(pl.col("faction") == name).is_empty():
             self._reputations = self._reputations.vstack(
@@ -379,6 +383,12 @@ class FactionLedger:
                 pl.DataFrame(trait_rows, schema={"faction": pl.String, "trait": pl.String, "value": pl.Float64})
             )
 
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever the set of factions changes."""
+
+        return self._revision
+
     def iterate_factions(self) -> Iterator[FactionRecord]:
         for row in self._factions.iter_rows(named=True):
             yield FactionRecord(self, row["name"])
@@ -127,6 +127,7 @@ class Inventory:
         self.max_weight = float("inf") if max_weight is None else float(max_weight)
         self.max_volume = float("inf") if max_volume is None else float(max_volume)
         self._items: dict[str, InventoryItem] = {}
+        self._revision = 0
 
     # -- Introspection -------------------------------------------------
     def __iter__(self) -> Iterator[InventoryItem]:
@@ -136,6 +137,12 @@ class Inventory:
     def items(self) -> Mapping[str, InventoryItem]:
         return self._items
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever the stored cargo changes."""
+
+        return self._revision
+
     @property
     def total_weight(self) -> float:
         return sum(item.total_weight for item in self._items.values())
@@ -190,6 +197,7 @@ class Inventory:
             additional_weight=item.total_weight,
             additional_volume=item.total_volume,
         )
+        self._revision += 1
         existing = self._items.get(item.item_id)
         if merge and existing is not None:
             if (
@@ -219,6 +227,7 @@ class Inventory:
         if item.quantity + 1e-9 < quantity:
             raise InsufficientInventoryError(f"Insufficient quantity of '{item_id}'")
         removed = item.clone(quantity=quantity)
+        self._revision += 1
         item.quantity -= quantity
         if item.quantity <= 1e-6:
             self._items.pop(item_id, None)
@@ -268,6 +277,7 @@ class Inventory:
             if item.spoilage.spoiled and remove_spoiled:
                 spoiled.append((item_id, item.quantity))
                 self._items.pop(item_id, None)
+                self._revision += 1
         return spoiled
 
 
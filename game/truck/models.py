@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import NamedTuple
 
 from .inventory import Inventory
 
@@ -20,6 +22,13 @@ class ModuleNotEquippedError(LookupError):
     """Raised when attempting to unequip a module that is not present."""
 
 
+# Dimensions are packed into 21-bit lanes with the top bit of each lane used as
+# a guard, so a single subtraction compares all three axes at once.
+_LANE_BITS = 21
+_LANE_LIMIT = 1 << (_LANE_BITS - 1)
+_LANE_GUARDS = (_LANE_LIMIT << (2 * _LANE_BITS)) | (_LANE_LIMIT << _LANE_BITS) | _LANE_LIMIT
+
+
 @dataclass(frozen=True)
 class Dimensions:
     """Physical dimensions measured in abstract grid units."""
@@ -28,16 +37,27 @@ class Dimensions:
     width: int
     height: int
 
+    @cached_property
+    def _packed(self) -> int | None:
+        if not all(0 <= value < _LANE_LIMIT for value in (self.length, self.width, self.height)):
+            return None
+        return (self.length << (2 * _LANE_BITS)) | (self.width << _LANE_BITS) | self.height
+
     def fits_within(self, other: Dimensions) -> bool:
         """Return True if these dimensions fit within the provided envelope."""
 
+        mine = self._packed
+        theirs = other._packed
+        if mine is not None and theirs is not None:
+            # Each lane keeps its guard bit only when other >= self on that axis.
+            return ((theirs | _LANE_GUARDS) - mine) & _LANE_GUARDS == _LANE_GUARDS
         return (
             self.length <= other.length
             and self.width <= other.width
             and self.height <= other.height
         )
 
-    @property
+    @cached_property
     def volume(self) -> int:
         """Simple volume calculation for capacity comparison."""
 
@@ -95,6 +115,17 @@ class TruckStats:
         return self.power_output - self.power_draw
 
 
+class _ModuleTotals(NamedTuple):
+    """Sums of the per-module contributions gathered in a single pass."""
+
+    power_output: int
+    power_draw: int
+    storage_bonus: int
+    weight_bonus: float
+    crew_required: int
+    maintenance_load: int
+
+
 @dataclass
 class MaintenanceReport:
     """Summary of the maintenance phase for logging or UI consumption."""
@@ -102,7 +133,7 @@ class MaintenanceReport:
     maintenance_applied: float
     maintenance_required: float
     truck_condition: float
-    module_conditions: dict[str, float]
+    module_conditions: Mapping[str, float]
     degraded_modules: list[str] = field(default_factory=list)
     cost_multiplier: float = 1.0
 
@@ -129,6 +160,9 @@ class Truck:
     inventory: Inventory = field(default_factory=Inventory)
 
     def __post_init__(self) -> None:
+        # Running total maintained by equip/unequip so capacity checks stay O(1).
+        self._occupied_volume = sum(module.size.volume for module in self.modules.values())
+        self._last_module_conditions: dict[str, float] | None = None
         self._sync_inventory_capacity()
 
     def equip_module(self, module: TruckModule) -> None:
@@ -148,6 +182,7 @@ class Truck:
         ):
             raise CrewOverloadError("Equipping module would exceed available crew capacity")
         self.modules[module.module_id] = module
+        self._occupied_volume += module.size.volume
         self._sync_inventory_capacity()
 
     def unequip_module(self, module_id: str) -> TruckModule:
@@ -157,6 +192,7 @@ class Truck:
             module = self.modules.pop(module_id)
         except KeyError as exc:  # pragma: no cover - defensive branch
             raise ModuleNotEquippedError(module_id) from exc
+        self._occupied_volume -= module.size.volume
         self._sync_inventory_capacity()
         return module
 
@@ -204,21 +240,38 @@ class Truck:
             max_volume=self.storage_capacity,
         )
 
+    def _aggregate(self) -> _ModuleTotals:
+        power_output = power_draw = storage_bonus = crew_required = maintenance_load = 0
+        weight_bonus = 0.0
+        for module in self.modules.values():
+            power_output += module.power_output
+            power_draw += module.power_draw
+            storage_bonus += module.storage_bonus
+            weight_bonus += module.weight_bonus
+            crew_required += module.crew_required
+            maintenance_load += module.maintenance_load
+        return _ModuleTotals(
+            power_output,
+            power_draw,
+            storage_bonus,
+            weight_bonus,
+            crew_required,
+            maintenance_load,
+        )
+
     @property
     def stats(self) -> TruckStats:
+        totals = self._aggregate()
+        has_inventory = isinstance(self.inventory, Inventory)
         return TruckStats(
-            power_output=self.power_output,
-            power_draw=self.power_draw,
-            storage_capacity=self.storage_capacity,
-            weight_capacity=self.weight_capacity,
-            cargo_weight=self.inventory.total_weight
-            if isinstance(self.inventory, Inventory)
-            else 0.0,
-            cargo_volume=self.inventory.total_volume
-            if isinstance(self.inventory, Inventory)
-            else 0.0,
-            crew_workload=self.current_crew_workload,
-            maintenance_load=self.maintenance_load,
+            power_output=self.base_power_output + totals.power_output,
+            power_draw=self.base_power_draw + totals.power_draw,
+            storage_capacity=self.base_storage_capacity + totals.storage_bonus,
+            weight_capacity=self.base_weight_capacity + totals.weight_bonus,
+            cargo_weight=self.inventory.total_weight if has_inventory else 0.0,
+            cargo_volume=self.inventory.total_volume if has_inventory else 0.0,
+            crew_workload=totals.crew_required,
+            maintenance_load=self.base_maintenance_load + totals.maintenance_load,
         )
 
     def run_maintenance_cycle(
@@ -243,23 +296,32 @@ class Truck:
         if self.condition != previous_condition:
             degraded_modules.append("base_vehicle")
 
+        modules_degraded = False
         for module in self.modules.values():
             if module.apply_degradation(stress):
                 degraded_modules.append(module.module_id)
+                modules_degraded = True
+
+        # Reports share the previous snapshot while no module changed; the
+        # mapping is read-only from the report's point of view.
+        module_conditions = self._last_module_conditions
+        if (
+            modules_degraded
+            or module_conditions is None
+            or module_conditions.keys() != self.modules.keys()
+        ):
+            module_conditions = {mid: mod.condition for mid, mod in self.modules.items()}
+            self._last_module_conditions = module_conditions
 
         report = MaintenanceReport(
             maintenance_applied=maintenance_points,
             maintenance_required=required,
             truck_condition=self.condition,
-            module_conditions={mid: mod.condition for mid, mod in self.modules.items()},
+            module_conditions=module_conditions,
             degraded_modules=degraded_modules,
             cost_multiplier=cost_multiplier,
         )
         return report
 
-    @property
-    def _occupied_volume(self) -> int:
-        return sum(module.size.volume for module in self.modules.values())
-
     def iter_modules(self) -> Iterable[TruckModule]:
         return self.modules.values()
@@ -2,45 +2,140 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping, Sequence, Mapping
+import asyncio
+import heapq
+import itertools
+import re
+import sys
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from textual.app import App, ComposeResult
+from textual.app import App
 from textual.binding import Binding
-from textual.containers import Container
-from textual.widgets import Footer, Header
-
-from ..crew import Crew
-from ..engine.resource_pipeline import ResourcePipeline
-from ..engine.turn_engine import TurnContext, TurnEngine
-from ..engine.world import (
-    CrewComponent,
-    FactionControllerComponent,
-    GameWorld,
-    SitesComponent,
-    TruckComponent,
-)
-from ..events.event_queue import EventQueue
-from ..factions import FactionAIController
-from ..time.season_tracker import SeasonTracker
-from ..truck import Dimensions, Truck, TruckModule
-from ..truck.inventory import Inventory, InventoryItem, ItemCategory
-from ..world.map import BiomeNoise, HexCoord
-from ..world.rng import WorldRandomness
-from ..world.sites import Site
-from ..world.stateframes import SiteStateFrame
-from .channels import NotificationChannel, TurnLogChannel
+
+from .channels import _EMPTY_PAYLOAD, NotificationChannel, NotificationRecord, TurnLogChannel
 from .config_store import HexLayoutConfig
 from .control_panel import ControlPanel, ControlPanelWidget
 from .dashboard import DashboardView, TurnLogWidget
-from .diplomacy import DiplomacyView
 from .hex_canvas import HexCanvas
 from .help import HelpScreen, HelpSection, build_help_commands
 from .truck_layout import TruckLayoutView
 
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checkers
+    from textual.app import ComposeResult
+
+    from ..engine.turn_engine import TurnContext, TurnEngine
+    from ..factions import FactionAIController, FactionRecord
+    from ..truck import Truck
+    from .diplomacy import DiplomacyView
+
+# The engine, world, crew and faction subtrees (and the diplomacy widget, which
+# pulls in the faction ledger) are imported inside the methods that need them.
+# They drag in Polars, NetworkX and NumPy, so deferring them keeps
+# ``import game.ui.app`` close to the cost of Textual itself.
+
+
+# Terrain lookup tables are constant, so every app instance shares one copy.
+_TERRAIN_SYMBOLS: Mapping[str, str] = MappingProxyType(
+    {
+        "plains": "Pl",
+        "forest": "Fo",
+        "tundra": "Tu",
+        "mountain": "Mt",
+        "coast": "Co",
+        "ruin": "Ru",
+        "wasteland": "Wa",
+        "scrub": "Sc",
+        "desert": "De",
+        "swamp": "Sw",
+    }
+)
+_TERRAIN_FILL_CODES: Mapping[str, str] = MappingProxyType(
+    {
+        "forest": "Fo",
+        "swamp": "Fo",
+        "plains": "Sc",
+        "scrub": "Sc",
+        "tundra": "Sc",
+        "coast": "Sc",
+        "ruin": "Ba",
+        "wasteland": "Ba",
+        "mountain": "Ba",
+        "desert": "Ba",
+    }
+)
+
+
+# Terrain names come from a small vocabulary, so the normalised lookups are
+# memoised per raw string rather than re-stripped on every call.
+@lru_cache(maxsize=128)
+def _terrain_symbol(terrain: str) -> str:
+    trimmed = terrain.strip()
+    if not trimmed:
+        return "??"
+    normalised = trimmed.lower()
+    symbol = _TERRAIN_SYMBOLS.get(normalised)
+    if symbol:
+        return symbol
+    if len(trimmed) == 1:
+        return trimmed.upper()
+    return trimmed[:2].title()
+
+
+@lru_cache(maxsize=128)
+def _terrain_code(terrain: str) -> str:
+    trimmed = terrain.strip()
+    if not trimmed:
+        return "Sc"
+    return _TERRAIN_FILL_CODES.get(trimmed.lower(), "Sc")
+
+
+# Missions spawned by world events carry a type ending in this suffix.  The
+# checks compare a prebuilt tail slice against it rather than dispatching
+# ``str.endswith`` for every mission.
+_EVENT_SUFFIX = "_event"
+_EVENT_SLICE = slice(-len(_EVENT_SUFFIX), None)
+
+# Seasons in which travelling caravans and pandemics can occur.
+_CARAVAN_SEASONS = frozenset({"spring", "summer"})
+_PANDEMIC_SEASONS = frozenset({"autumn", "winter"})
+
+# Missions spawned by world events: event type -> (mission type, description,
+# reward, days until expiry).  Event types without an entry spawn no mission.
+_EVENT_MISSION_TEMPLATES: Mapping[str, tuple[str, str, float, int]] = MappingProxyType(
+    {
+        "caravan": (
+            "escort_caravan_event",
+            "Escort a travelling caravan spawned by a world event.",
+            15.0,
+            5,
+        ),
+        "pandemic": (
+            "deliver_aid_event",
+            "Deliver aid to settlements affected by a spreading illness.",
+            20.0,
+            5,
+        ),
+        "storm": (
+            "weather_recon_event",
+            "Gather weather data and assist travellers during an intensifying storm.",
+            10.0,
+            4,
+        ),
+        "derelict": (
+            "salvage_event",
+            "Salvage supplies from a derelict convoy spotted nearby.",
+            15.0,
+            6,
+        ),
+    }
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class AppConfig:
     """Configuration payload for the UI bootstrap."""
 
@@ -49,50 +144,173 @@ class AppConfig:
     world_seed: int = 42
 
 
-class SurvivalTruckApp(App[Any]):
-    """Interactive Textual application for Survival Truck."""
+@lru_cache(maxsize=8)
+def _compute_demo_grid(size: int, seed: int) -> tuple[tuple[str, ...], ...]:
+    """Return the biome names for the demo map, shared across app instances."""
 
-    CSS = """
-    /* Minimal dark theme — only supported properties are used */
-    * {
-        border: none;
-        background: #141414;
-        color: #c0c0c0;
-    }
-    Header, Footer {
-        background: #1c1c1c;
-        color: #7a7a7a;
-        text-style: bold;
-    }
+    from ..world.map import BiomeNoise
+    from ..world.rng import WorldRandomness
 
-    Screen { layout: grid; grid-rows: auto 1fr auto; }
+    noise = BiomeNoise(randomness=WorldRandomness(seed=seed))
+    half = size // 2
+    axis = range(-half, half + 1)
+    names = tuple(biome.value for biome in BiomeNoise.BIOME_BANDS)
+    ids = noise.biome_ids(axis, axis)
+    return tuple(tuple(names[index] for index in row) for row in ids.tolist())
 
-    #body {
-        layout: grid;
-        grid-size: 2 5;
-        grid-columns: 3fr 2fr;
-        grid-rows: auto auto auto auto 1fr;
-        grid-gutter: 1;
-        padding: 1;
-        height: 1fr;
-    }
 
-    /* Placement is by compose() order; spans only */
-    HexCanvas {
-        row-span: 4;
-    }
+@lru_cache(maxsize=32)
+def _layout_summary_rows(
+    orientation: str,
+    hex_height: float,
+    flatten: float,
+    origin_x: float,
+    origin_y: float,
+    offset_mode: str,
+) -> tuple[tuple[str, str], ...]:
+    return (
+        ("Orientation", orientation.title()),
+        ("Hex Height", f"{hex_height:.1f}"),
+        ("Flatten", f"{flatten:.2f}"),
+        ("Origin", f"({origin_x:.1f}, {origin_y:.1f})"),
+        ("Offset", offset_mode),
+    )
 
-    #status { }
-    #diplomacy { }
-    #truck { }
-    #controls { }
 
-    TurnLogWidget {
-        column-span: 2;
-        border-top: tall #4db6ac;
-    }
+MissionKey = tuple[str, str, int]
+
+
+def _coerce_expiry(value: Any) -> int:
+    """Return ``value`` as an expiry day, or ``0`` when ``int()`` rejects it.
+
+    Restored saves may carry ``"12"`` or ``12.0``; ``0`` has already been
+    reached by every turn day, so unusable expiries count as expired.
     """
 
+    try:
+        return int(value)
+    except Exception:
+        return 0
+
+
+def _mission_key(mission: Mapping[str, object]) -> MissionKey:
+    """Return the canonical ``(faction, type, expires)`` identity of a mission.
+
+    The expiry goes through :func:`_coerce_expiry`, so missions without a
+    usable expiry dedupe together and count as expired.
+    """
+
+    return (
+        str(mission.get("faction", "")),
+        str(mission.get("type", "")),
+        _coerce_expiry(mission.get("expires")),
+    )
+
+
+# Route labels only depend on the waypoint ordinal, so the common ones are
+# formatted once up front; index 0 is unused padding for 1-based lookups.
+_HIGHLIGHT_LABELS: tuple[str, ...] = ("",) + tuple(
+    f"[yellow]{index:02}[/yellow]" for index in range(1, 257)
+)
+
+
+def _waypoint_label(index: int) -> str:
+    """Markup for the ``index``-th (1-based) route highlight on the map."""
+
+    if 0 < index < len(_HIGHLIGHT_LABELS):
+        return _HIGHLIGHT_LABELS[index]
+    return f"[yellow]{index:02}[/yellow]"
+
+
+def _intern_record_keys(records: list[Any]) -> None:
+    """Intern the ``faction`` and ``type`` fields of loaded mission records.
+
+    Strings decoded from a save are fresh objects; interning them lets the
+    per-turn membership and equality checks match by identity.
+    """
+
+    for record in records:
+        if not isinstance(record, MutableMapping):
+            continue
+        for field_name in ("faction", "type"):
+            value = record.get(field_name)
+            if isinstance(value, str):
+                record[field_name] = sys.intern(value)
+
+
+@cache
+def _cached_bindings(cls: type) -> tuple[Binding, ...]:
+    """Return the ``Binding`` entries declared on ``cls``; BINDINGS is class-level."""
+
+    candidate = getattr(cls, "BINDINGS", None)
+    if not isinstance(candidate, Sequence):
+        return ()
+    return tuple(binding for binding in candidate if isinstance(binding, Binding))
+
+
+def _read_saved_state() -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Load the default save slot, returning ``None`` if it is unavailable."""
+
+    try:
+        from ..world.persistence import load_game_state
+    except Exception:
+        return None
+    try:
+        return load_game_state(slot="default")
+    except Exception:
+        return None
+
+
+# The stylesheet is written readably here and minified once at import time:
+# comments are stripped and whitespace collapsed before Textual parses it.
+_CSS_SOURCE = """
+/* Minimal dark theme — only supported properties are used */
+* {
+    border: none;
+    background: #141414;
+    color: #c0c0c0;
+}
+Header, Footer {
+    background: #1c1c1c;
+    color: #7a7a7a;
+    text-style: bold;
+}
+
+Screen { layout: grid; grid-rows: auto 1fr auto; }
+
+#body {
+    layout: grid;
+    grid-size: 2 5;
+    grid-columns: 3fr 2fr;
+    grid-rows: auto auto auto auto 1fr;
+    grid-gutter: 1;
+    padding: 1;
+    height: 1fr;
+}
+
+/* Placement is by compose() order; spans only */
+HexCanvas {
+    row-span: 4;
+}
+
+#status { }
+#diplomacy { }
+#truck { }
+#controls { }
+
+TurnLogWidget {
+    column-span: 2;
+    border-top: tall #4db6ac;
+}
+"""
+_CSS = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", _CSS_SOURCE, flags=re.S)).strip()
+
+
+class SurvivalTruckApp(App[Any]):
+    """Interactive Textual application for Survival Truck."""
+
+    CSS = _CSS
+
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("space", "next_turn", "Next Day"),
@@ -109,6 +327,13 @@ class SurvivalTruckApp(App[Any]):
         log_channel: TurnLogChannel | None = None,
         notification_channel: NotificationChannel | None = None,
     ) -> None:
+        from ..engine.resource_pipeline import ResourcePipeline
+        from ..engine.turn_engine import TurnEngine
+        from ..engine.world import GameWorld
+        from ..events.event_queue import EventQueue
+        from ..time.season_tracker import SeasonTracker
+        from ..world.rng import WorldRandomness
+
         super().__init__()
         self.log_channel = log_channel or TurnLogChannel()
         self.notification_channel = notification_channel or NotificationChannel()
@@ -117,39 +342,34 @@ class SurvivalTruckApp(App[Any]):
         if config is None:
             config = self._create_demo_config()
         self._map_data: list[list[str]] = [list(row) for row in config.map_data]
-        self._terrain_symbols: dict[str, str] = {
-            "plains": "Pl",
-            "forest": "Fo",
-            "tundra": "Tu",
-            "mountain": "Mt",
-            "coast": "Co",
-            "ruin": "Ru",
-            "wasteland": "Wa",
-            "scrub": "Sc",
-            "desert": "De",
-            "swamp": "Sw",
-        }
-        self._terrain_fill_codes: dict[str, str] = {
-            "forest": "Fo",
-            "swamp": "Fo",
-            "plains": "Sc",
-            "scrub": "Sc",
-            "tundra": "Sc",
-            "coast": "Sc",
-            "ruin": "Ba",
-            "wasteland": "Ba",
-            "mountain": "Ba",
-            "desert": "Ba",
-        }
+        # Grid dimensions are cached so bounds checks avoid ``len`` calls.
+        self._map_rows = 0
+        self._map_cols = 0
+        self._map_ragged = False
+        self._sync_map_shape()
         self.world_state: dict[str, object] = dict(config.world_state)
         self.world_randomness = WorldRandomness(seed=config.world_seed)
         self.world_state.setdefault("randomness", self.world_randomness)
-
+        # Per-turn streams are bound once.  Each stream name yields its own
+        # independent sequence based off the world seed, ensuring that events
+        # are reproducible across runs.
+        self._events_rng = self.world_randomness.generator("events")
+        self._dispatch_rng = self.world_randomness.generator("event-dispatch")
+        self._bind_event_list()
+
+        # The world is final here: an injected engine's world is reused and a
+        # freshly built engine is handed this one, so components register once.
         self.world = turn_engine.world if turn_engine is not None else GameWorld()
+        self._truck_ref: Truck | None = None
+        self._cargo_ratio_cache: tuple[object, int | None, float, float] | None = None
+        self._faction_names_cache: tuple[object, int, tuple[str, ...]] | None = None
         self._bootstrap_world_components()
 
         self.event_queue = EventQueue()
         self.season_tracker = SeasonTracker()
+        # The season only changes at turn boundaries, so the dashboard label
+        # is recomputed once per turn rather than on every refresh.
+        self._season_label = self.season_tracker.current_season.name.title()
         self.turn_engine = turn_engine or TurnEngine(
             season_tracker=self.season_tracker,
             event_queue=self.event_queue,
@@ -159,86 +379,73 @@ class SurvivalTruckApp(App[Any]):
             world=self.world,
         )
         self.weather_system = self.turn_engine.weather_system
-        if turn_engine is not None:
-            self.world = self.turn_engine.world
-            self._bootstrap_world_components()
 
-        # ------------------------------------------------------------------
-        # Restore persisted simulation state.  The persistence manager
-        # stores both world_state entries (events, missions, negotiations)
-        # and faction data (ideology weights, traits, reputation) in a
-        # single save file.  After world and AI components have been
-        # initialised, we merge any saved values into the active state.
-        try:
-            from ..world.persistence import load_game_state  # type: ignore
-        except Exception:
-            load_game_state = None  # type: ignore[assignment]
-        if load_game_state is not None:
-            try:
-                saved_state, saved_factions = load_game_state(slot="default")
-                if isinstance(saved_state, Mapping):
-                    # Update world_state but avoid overwriting randomness or
-                    # other non‑persisted keys; saved_state was already
-                    # filtered when written.
-                    self.world_state.update(saved_state)
-                # Restore faction ideology weights, traits and reputation
-                fc_comp = self.turn_engine.world.get_singleton(FactionControllerComponent)
-                controller = fc_comp.controller if fc_comp is not None else None
-                if controller is not None and isinstance(saved_factions, Mapping):
-                    for fac_name, fac_data in saved_factions.items():
-                        if fac_name not in controller.factions:
-                            continue
-                        # Ideology weights
-                        try:
-                            ide_weights = fac_data.get("ideology_weights", None)
-                            if isinstance(ide_weights, Mapping):
-                                controller.ledger.set_ideology_weights(fac_name, ide_weights)  # type: ignore[attr-defined]
-                        except Exception:
-                            pass
-                        # Traits
-                        traits_data = fac_data.get("traits", {})
-                        if isinstance(traits_data, Mapping):
-                            for t_name, t_val in traits_data.items():
-                                try:
-                                    controller.ledger.set_trait(fac_name, str(t_name), float(t_val))
-                                except Exception:
-                                    continue
-                        # Reputation
-                        try:
-                            rep_val = float(fac_data.get("reputation", 0.0))
-                            current_rep = float(getattr(controller.factions[fac_name], "reputation", 0.0))
-                            delta = rep_val - current_rep
-                            if abs(delta) > 1e-6:
-                                controller.factions[fac_name].adjust_reputation(delta)
-                        except Exception:
-                            pass
-            except Exception:
-                # Ignore failures in loading state; the game will start fresh.
-                pass
-
-        rows = len(self._map_data)
-        cols = max((len(row) for row in self._map_data), default=0)
+        # (grid, tiles, labels) for the grid currently shown on the canvas.
+        # Keyed on the grid object itself, so assigning a new ``_map_data``
+        # is what triggers a rebuild.
+        self._canvas_payload: (
+            tuple[object, dict[tuple[int, int], str], dict[tuple[int, int], str]] | None
+        ) = None
         initial_tiles, initial_labels = self._build_canvas_payload(self._map_data)
         self.map_view = HexCanvas(
-            cols=cols,
-            rows=rows,
+            cols=self._map_cols,
+            rows=self._map_rows,
             radius=12,
             tiles=initial_tiles,
             labels=initial_labels,
         )
         self.dashboard = DashboardView(notification_channel=self.notification_channel)
-        self.diplomacy_view = DiplomacyView()
-        self.truck_view = TruckLayoutView()
+        # The diplomacy and truck panes are built on first access (normally
+        # compose), so constructing an app that never runs skips them.
+        self._diplomacy_view: DiplomacyView | None = None
+        self._truck_view: TruckLayoutView | None = None
         self.control_widget = ControlPanelWidget(self.control_panel)
         self.log_widget = TurnLogWidget(self.log_channel)
         self._help_visible = False
+        # Help content only depends on class-level bindings; built on first open.
+        self._help_sections: list[HelpSection] | None = None
+        self._highlighted_route: tuple[tuple[int, int], ...] | None = None
+        self._turn_played = False
+        # Holds ``(controller,)`` once resolved; cleared at each turn boundary.
+        self._controller_cache: tuple[FactionAIController | None] | None = None
+        # (missions list, per-mission keys) recorded when a phase writes the
+        # mission list, so the next phase reading it skips re-extracting keys.
+        self._mission_index: tuple[object, list[MissionKey]] | None = None
+        # (missions list, flags) recorded by the expiry pass for _refresh_ui.
+        self._event_flags_cache: tuple[object, dict[str, bool]] | None = None
+        self._pending_notifications: list[NotificationRecord] | None = None
+        self._save_task: asyncio.Task[None] | None = None
+        self._pending_save: dict[str, Any] | None = None
+        self._last_saved_payload: dict[str, Any] | None = None
+        # Min-heap of (expires, seq, record) mirroring world_state["active_events"]
+        # so each turn only pops the events that have actually expired.
+        self._active_event_heap: list[tuple[int, int, dict[str, object]]] = []
+        self._active_event_seq = itertools.count()
+        self._active_events_source: list[dict[str, object]] | None = None
         # Summarise the loaded layout and mark it as saved (no unsaved flag).
         initial_cfg = HexLayoutConfig.load()
         self.dashboard.update_layout_config(
             self._summarise_layout_config(initial_cfg), unsaved=initial_cfg.dirty
         )
 
+    @property
+    def diplomacy_view(self) -> DiplomacyView:
+        if self._diplomacy_view is None:
+            from .diplomacy import DiplomacyView
+
+            self._diplomacy_view = DiplomacyView()
+        return self._diplomacy_view
+
+    @property
+    def truck_view(self) -> TruckLayoutView:
+        if self._truck_view is None:
+            self._truck_view = TruckLayoutView()
+        return self._truck_view
+
     def compose(self) -> ComposeResult:
+        from textual.containers import Container
+        from textual.widgets import Footer, Header
+
         yield Header(show_clock=True)
         with Container(id="body"):
             yield self.map_view
@@ -251,119 +458,155 @@ class SurvivalTruckApp(App[Any]):
 
     def on_mount(self) -> None:
         self._refresh_ui()
+        # Persisted state is read off the event loop and merged once it
+        # arrives, so disk I/O no longer delays the first frame.
+        self.run_worker(self._restore_saved_state(), exclusive=False)
+
+    async def _restore_saved_state(self) -> None:
+        saved = await asyncio.to_thread(_read_saved_state)
+        if saved is None or self._turn_played:
+            # A save merged after the player has advanced would rewind the
+            # live simulation, so late results are dropped.
+            return
+        try:
+            self._apply_saved_state(*saved)
+        except Exception:
+            # Ignore failures in loading state; the game will start fresh.
+            return
+        self._refresh_ui()
+
+    def _apply_saved_state(self, saved_state: object, saved_factions: object) -> None:
+        """Merge a persisted ``world_state`` and faction data into the session.
+
+        The persistence manager stores both world_state entries (events,
+        missions, negotiations) and faction data (ideology weights, traits,
+        reputation) in a single save file.
+        """
+
+        if isinstance(saved_state, Mapping):
+            # Update world_state but avoid overwriting randomness or
+            # other non‑persisted keys; saved_state was already
+            # filtered when written.
+            self.world_state.update(saved_state)
+            self._bind_event_list()
+            for key in ("missions", "negotiations"):
+                records = self.world_state.get(key)
+                if isinstance(records, list):
+                    _intern_record_keys(records)
+        # Restore faction ideology weights, traits and reputation
+        controller = self._faction_controller()
+        if controller is not None and isinstance(saved_factions, Mapping):
+            for fac_name, fac_data in saved_factions.items():
+                if fac_name not in controller.factions:
+                    continue
+                # Ideology weights
+                try:
+                    ide_weights = fac_data.get("ideology_weights", None)
+                    if isinstance(ide_weights, Mapping):
+                        controller.ledger.set_ideology_weights(fac_name, ide_weights)  # type: ignore[attr-defined]
+                except Exception:
+                    pass
+                # Traits
+                traits_data = fac_data.get("traits", {})
+                if isinstance(traits_data, Mapping):
+                    for t_name, t_val in traits_data.items():
+                        try:
+                            controller.ledger.set_trait(fac_name, str(t_name), float(t_val))
+                        except Exception:
+                            continue
+                # Reputation
+                try:
+                    rep_val = float(fac_data.get("reputation", 0.0))
+                    current_rep = float(getattr(controller.factions[fac_name], "reputation", 0.0))
+                    delta = rep_val - current_rep
+                    if abs(delta) > 1e-6:
+                        controller.factions[fac_name].adjust_reputation(delta)
+                except Exception:
+                    pass
 
     # ------------------------------------------------------------------
     def _bootstrap_world_components(self) -> None:
+        from ..crew import Crew
+        from ..engine.world import (
+            CrewComponent,
+            FactionControllerComponent,
+            SitesComponent,
+            TruckComponent,
+        )
+        from ..factions import FactionAIController
+        from ..truck import Truck
+        from ..world.rng import WorldRandomness
+        from ..world.sites import Site
+        from ..world.stateframes import SiteStateFrame
+
         truck = self.world_state.get("truck")
         if isinstance(truck, Truck):
-            self.world.add_singleton(TruckComponent(truck))
+            self._register_singleton(TruckComponent, "truck", truck)
             self.world_state["truck"] = truck
+            self._truck_ref = truck
+        else:
+            truck_comp = self.world.get_singleton(TruckComponent)
+            self._truck_ref = truck_comp.truck if truck_comp is not None else None
         randomness = self.world_state.get("randomness")
         world_rng = randomness if isinstance(randomness, WorldRandomness) else None
         crew_obj = self.world_state.get("crew")
         if not isinstance(crew_obj, Crew):
             crew_obj = Crew(randomness=world_rng)
             self.world_state["crew"] = crew_obj
-        self.world.add_singleton(CrewComponent(crew_obj))
+        self._register_singleton(CrewComponent, "crew", crew_obj)
 
         controller = self.world_state.get("faction_controller")
         if not isinstance(controller, FactionAIController):
             controller = FactionAIController(randomness=world_rng)
             self.world_state["faction_controller"] = controller
-        self.world.add_singleton(FactionControllerComponent(controller))
+        self._register_singleton(FactionControllerComponent, "controller", controller)
 
         sites_obj = self.world_state.get("sites")
         if isinstance(sites_obj, SiteStateFrame):
             site_state = sites_obj
         elif isinstance(sites_obj, MutableMapping):
-            filtered: dict[str, Site] = {}
-            for key, value in sites_obj.items():
-                if isinstance(key, str) and isinstance(value, Site):
-                    filtered[key] = value
+            filtered: dict[str, Site] = {
+                key: value
+                for key, value in sites_obj.items()
+                if isinstance(key, str) and isinstance(value, Site)
+            }
             site_state = SiteStateFrame.from_sites(filtered)
         else:
             site_state = SiteStateFrame()
         self.world_state["sites"] = site_state
-        self.world.add_singleton(SitesComponent(site_state))
+        self._register_singleton(SitesComponent, "sites", site_state)
+
+    def _bind_event_list(self) -> None:
+        # Queued world events live in one list that is cleared in place after
+        # dispatch, so the generator and dispatcher share it by reference.
+        events = self.world_state.get("events")
+        if not isinstance(events, list):
+            events = []
+            self.world_state["events"] = events
+        self._events_list: list[dict[str, object]] = events
+
+    def _register_singleton(self, component_type: type[Any], attr: str, value: object) -> None:
+        """Register ``value`` as a world singleton unless it is already wrapped."""
+
+        existing = self.world.get_singleton(component_type)
+        if existing is not None and getattr(existing, attr, None) is value:
+            return
+        self.world.add_singleton(component_type(value))
 
     def action_next_turn(self) -> None:
+        self._turn_played = True
+        self._controller_cache = None
         command = self.control_panel.build_command_payload()
         context = self.turn_engine.run_turn(command, world_state=self.world_state)
+        self._season_label = self.season_tracker.current_season.name.title()
+        # Notifications raised by the phases below are buffered and handed to
+        # the channel in one batch before the UI refresh.
+        self._pending_notifications = []
 
-        # Remove any expired active events before generating new ones.  Each
-        # event carries an 'expires' day; events with expiry <= current day
-        # are pruned from the active list.  This keeps the world_state
-        # consistent and prevents stale effects lingering forever.
-        try:
-            self._update_active_events(context)
-        except Exception as err:
-            if self.notification_channel is not None:
-                self.notification_channel.notify(
-                    day=self.season_tracker.current_day,
-                    message=f"Active event update failed: {err}",
-                    payload={},
-                )
+        self._advance_world(context)
 
-        # ------------------------------------------------------------------
-        # World events: generate emergent events based on season and weather.
-        # These random events add narrative variety (e.g. travelling caravans,
-        # bandit ambushes, storms).  The generator uses a seeded RNG to
-        # produce deterministic outcomes given the same world seed.  Any
-        # errors in event generation are reported via the notification
-        # channel but do not halt the turn progression.
-        try:
-            self._generate_world_events(context)
-        except Exception as err:
-            # Surface failures but continue processing the turn.
-            if self.notification_channel is not None:
-                self.notification_channel.notify(
-                    day=self.season_tracker.current_day,
-                    message=f"World event generation failed: {err}",
-                    payload={},
-                )
-
-        # Dispatch world events into missions and diplomatic consequences.
-        try:
-            self._dispatch_events(context)
-        except Exception as err:
-            if self.notification_channel is not None:
-                self.notification_channel.notify(
-                    day=self.season_tracker.current_day,
-                    message=f"Event dispatch failed: {err}",
-                    payload={},
-                )
-
-        # After world and events have advanced, process any outstanding
-        # negotiations. Negotiation proposals are generated by the faction AI
-        # controller and stored in the world_state under the "negotiations"
-        # key. Each proposal can be accepted or declined; this helper
-        # automatically selects a default response based on the proposal type
-        # and applies the resulting reputation adjustments. The proposal is
-        # removed from the list once processed. Errors are captured and
-        # surfaced via the notification channel.
-        try:
-            self._process_negotiations(context)
-        except Exception as err:
-            if self.notification_channel is not None:
-                self.notification_channel.notify(
-                    day=self.season_tracker.current_day,
-                    message=f"Negotiation processing failed: {err}",
-                    payload={},
-                )
-
-        # After processing negotiations, handle expired missions.  Missions
-        # generated from world events expire after a few days; failing
-        # to complete them reduces the player's reputation with the
-        # issuing faction.
-        try:
-            self._process_expired_missions(context)
-        except Exception as err:
-            if self.notification_channel is not None:
-                self.notification_channel.notify(
-                    day=self.season_tracker.current_day,
-                    message=f"Expired mission processing failed: {err}",
-                    payload={},
-                )
+        pending, self._pending_notifications = self._pending_notifications, None
+        self.notification_channel.push_many(pending)
 
         self.control_panel.reset()
         self.control_widget.refresh_from_panel()
@@ -374,18 +617,118 @@ class SurvivalTruckApp(App[Any]):
         # the persistence manager.  This ensures that events, missions,
         # negotiations and faction attributes survive across sessions.
         try:
-            from ..world.persistence import save_game_state  # type: ignore
+            controller = self._faction_controller()
+            if controller is not None:
+                self._queue_save(controller)
         except Exception:
-            save_game_state = None  # type: ignore[assignment]
-        if save_game_state is not None:
+            # Ignore persistence errors; state will be saved on next turn.
+            pass
+
+    def _faction_controller(self) -> FactionAIController | None:
+        """Return the faction controller, resolved once per turn."""
+
+        cached = self._controller_cache
+        if cached is None:
+            from ..engine.world import FactionControllerComponent
+
+            component = self.turn_engine.world.get_singleton(FactionControllerComponent)
+            cached = (component.controller if component is not None else None,)
+            self._controller_cache = cached
+        return cached[0]
+
+    def _advance_world(self, context: TurnContext) -> None:
+        """Run the post-turn world phases in order.
+
+        Each phase is isolated: a failure is surfaced via the notification
+        channel but does not stop the phases after it or halt the turn.
+        """
+
+        phases = (
+            # Prune active events whose expiry day has passed before new
+            # ones are generated.
+            (self._update_active_events, "Active event update"),
+            # Emit seeded random world events (caravans, ambushes, storms)
+            # based on season and weather.
+            (self._generate_world_events, "World event generation"),
+            # Turn queued events into missions and diplomatic consequences.
+            (self._dispatch_events, "Event dispatch"),
+            # Auto-resolve faction negotiation proposals and apply their
+            # reputation effects.
+            (self._process_negotiations, "Negotiation processing"),
+            # Penalise reputation for event missions that expired unanswered.
+            (self._process_expired_missions, "Expired mission processing"),
+        )
+        for phase, label in phases:
             try:
-                fc_comp = self.turn_engine.world.get_singleton(FactionControllerComponent)
-                controller = fc_comp.controller if fc_comp is not None else None
-                if controller is not None:
-                    save_game_state(self.world_state, controller, slot="default")
+                phase(context)
+            except Exception as err:
+                self._notify(
+                    day=self.season_tracker.current_day,
+                    message=f"{label} failed: {err}",
+                    payload={},
+                )
+
+    def _queue_save(self, controller: object) -> None:
+        """Snapshot the session and write it to disk off the event loop.
+
+        The payload is assembled here so the writer thread never sees live
+        state.  Turns taken while a write is in flight only keep their latest
+        snapshot, and a snapshot identical to the last one written is skipped.
+        """
+
+        from ..world.persistence import build_save_payload, write_save_payload
+
+        payload = build_save_payload(self.world_state, controller)
+        if payload == self._last_saved_payload:
+            return
+        self._pending_save = payload
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. driven from a script): write synchronously.
+            self._pending_save = None
+            write_save_payload(payload, slot="default")
+            self._last_saved_payload = payload
+            return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._drain_pending_saves())
+
+    async def _drain_pending_saves(self) -> None:
+        from ..world.persistence import write_save_payload
+
+        while self._pending_save is not None:
+            payload, self._pending_save = self._pending_save, None
+            try:
+                await asyncio.to_thread(write_save_payload, payload, slot="default")
             except Exception:
                 # Ignore persistence errors; state will be saved on next turn.
-                pass
+                continue
+            self._last_saved_payload = payload
+
+    async def on_unmount(self) -> None:
+        # Let an in-flight or coalesced save finish before the app exits.
+        if self._save_task is not None and not self._save_task.done():
+            await self._save_task
+
+    def _notify(
+        self,
+        day: int,
+        message: str,
+        *,
+        category: str = "info",
+        payload: Mapping[str, Any] | None = None,
+    ) -> NotificationRecord:
+        record = NotificationRecord(
+            day=day,
+            message=message,
+            category=category,
+            payload=dict(payload) if payload else _EMPTY_PAYLOAD,
+        )
+        if self._pending_notifications is not None:
+            self._pending_notifications.append(record)
+        else:
+            self.notification_channel.push(record)
+        return record
 
     def action_reset_route(self) -> None:
         self.control_panel.clear_route()
@@ -396,8 +739,9 @@ class SurvivalTruckApp(App[Any]):
             self.pop_screen()
             return
 
-        sections = self._build_help_sections()
-        help_screen = HelpScreen(sections, on_close=self._on_help_closed)
+        if self._help_sections is None:
+            self._help_sections = self._build_help_sections()
+        help_screen = HelpScreen(self._help_sections, on_close=self._on_help_closed)
         self._help_visible = True
         self.push_screen(help_screen)
 
@@ -406,56 +750,52 @@ class SurvivalTruckApp(App[Any]):
 
     # ------------------------------------------------------------------
     def on_hex_canvas_hex_clicked(self, message: HexCanvas.HexClicked) -> None:
-        row = int(message.r)
-        col = int(message.q)
-        waypoint = f"{row},{col}"
-        self.control_panel.append_waypoint(waypoint)
+        row = message.r
+        col = message.q
+        self.control_panel.append_waypoint((row, col))
         self.control_widget.refresh_from_panel()
         terrain = self._terrain_at(row, col)
         if terrain is not None:
-            self.dashboard.set_focus_detail(f"{waypoint} ({terrain})")
+            self.dashboard.set_focus_detail(f"{row},{col} ({terrain})")
         else:
-            self.dashboard.set_focus_detail(waypoint)
+            self.dashboard.set_focus_detail(f"{row},{col}")
         # Build site context details: summarise current events, missions and
         # negotiations in the world state.  This gives the player
         # situational awareness when clicking on the map.  We do not yet
         # associate events with specific sites, so we show a flat list.
+        events = self.world_state.get("active_events")
+        missions = self.world_state.get("missions")
+        negotiations = self.world_state.get("negotiations")
+        if not (events or missions or negotiations):
+            # Nothing to summarise: clear the panel without building lines.
+            self.dashboard.update_site_context([])
+            return
         lines: list[str] = []
-        try:
-            # Active events
-            events = self.world_state.get("active_events", [])
-            if isinstance(events, list):
-                for ev in events:
-                    try:
-                        desc = str(ev.get("description", ""))
-                        exp = int(ev.get("expires", 0))
-                        lines.append(f"Event: {desc} (expires day {exp})")
-                    except Exception:
-                        continue
-            # Missions
-            missions = self.world_state.get("missions", [])
-            if isinstance(missions, list):
-                for m in missions:
-                    try:
-                        fac = str(m.get("faction", ""))
-                        desc = str(m.get("description", ""))
-                        exp = int(m.get("expires", 0))
-                        lines.append(f"Mission: {desc} from {fac} (expires day {exp})")
-                    except Exception:
-                        continue
-            # Negotiations
-            negotiations = self.world_state.get("negotiations", [])
-            if isinstance(negotiations, list):
-                for n in negotiations:
-                    try:
-                        fac = str(n.get("faction", ""))
-                        desc = str(n.get("description", ""))
-                        exp = int(n.get("expires", 0))
-                        lines.append(f"Negotiation: {desc} from {fac} (expires day {exp})")
-                    except Exception:
-                        continue
-        except Exception:
-            lines = []
+        # Missing fields fall back to defaults; entries that are not records
+        # at all (e.g. from a hand-edited save) are skipped.
+        if isinstance(events, list):
+            for ev in events:
+                if not isinstance(ev, Mapping):
+                    continue
+                lines.append(
+                    f"Event: {ev.get('description', '')} (expires day {ev.get('expires', 0)})"
+                )
+        if isinstance(missions, list):
+            for m in missions:
+                if not isinstance(m, Mapping):
+                    continue
+                lines.append(
+                    f"Mission: {m.get('description', '')} from {m.get('faction', '')}"
+                    f" (expires day {m.get('expires', 0)})"
+                )
+        if isinstance(negotiations, list):
+            for n in negotiations:
+                if not isinstance(n, Mapping):
+                    continue
+                lines.append(
+                    f"Negotiation: {n.get('description', '')} from {n.get('faction', '')}"
+                    f" (expires day {n.get('expires', 0)})"
+                )
         # Update site context on the dashboard
         try:
             self.dashboard.update_site_context(lines)
@@ -475,54 +815,55 @@ class SurvivalTruckApp(App[Any]):
         Args:
             context: The turn context for the current day.
         """
-        # Acquire a deterministic RNG stream for event generation.  Each
-        # stream name yields its own independent sequence based off the
-        # world seed, ensuring that events are reproducible across runs.
-        rng = self.world_randomness.generator("events")
-
+        rng = self._events_rng
+        # Draw the turn's random numbers in one call.  Every slot is consumed
+        # each turn whether or not its branch applies, so the stream advances
+        # by a fixed amount per day.
+        (
+            caravan_roll,
+            ambush_roll,
+            storm_roll,
+            pandemic_roll,
+            derelict_roll,
+            storm_duration_roll,
+            pandemic_duration_roll,
+        ) = rng.random(7).tolist()
+
+        weather = context.weather
         season_name = getattr(context.season, "name", "unknown").lower()
-        weather_name = getattr(context.weather, "condition", None)
+        weather_name = getattr(weather, "condition", None)
         if weather_name is None:
             # The weather condition may be a WeatherCondition enum with a name
             # attribute; fall back to its string representation.
-            weather_name = str(getattr(context.weather, "name", "unknown")).lower()
+            weather_name = getattr(weather, "name", "unknown")
         weather_lower = str(weather_name).lower()
 
         events: list[tuple[str, str]] = []
 
         # Example random event: a travelling caravan appears in spring and
         # summer with a moderate probability.  Offer trade opportunities.
-        if season_name in {"spring", "summer"} and rng.random() < 0.05:
+        if season_name in _CARAVAN_SEASONS and caravan_roll < 0.05:
             events.append(("caravan", "A travelling caravan passes nearby, offering trade opportunities."))
 
         # Bandit ambushes are more likely when the player is carrying heavy
         # cargo; we approximate this by comparing cargo weight to capacity.
-        truck_comp = self.turn_engine.world.get_singleton(TruckComponent)
-        truck_obj = getattr(truck_comp, "truck", None) if truck_comp is not None else None
-        cargo_ratio = 0.0
-        if truck_obj is not None:
-            try:
-                cargo_weight = getattr(truck_obj.inventory, "total_weight", 0.0)
-                capacity = float(getattr(truck_obj, "weight_capacity", 1.0))
-                cargo_ratio = cargo_weight / max(capacity, 1.0)
-            except Exception:
-                cargo_ratio = 0.0
+        cargo_ratio = self._current_cargo_ratio()
         # Higher cargo ratio increases ambush probability.
         ambush_chance = 0.02 + min(0.2, cargo_ratio * 0.3)
-        if rng.random() < ambush_chance:
+        if ambush_roll < ambush_chance:
             events.append(("ambush", "Bandits ambush travellers in the area. Travel risk increases."))
 
         # Storm intensification: if the current weather contains "storm",
         # there is a chance the storm will intensify, increasing travel costs.
-        if "storm" in weather_lower and rng.random() < 0.2:
+        if "storm" in weather_lower and storm_roll < 0.2:
             events.append(("storm", "The storm intensifies, making travel more difficult."))
 
         # Pandemics or plagues: occur rarely, mostly in autumn and winter.
-        if season_name in {"autumn", "winter"} and rng.random() < 0.01:
+        if season_name in _PANDEMIC_SEASONS and pandemic_roll < 0.01:
             events.append(("pandemic", "An illness spreads among local settlements, reducing populations."))
 
         # Derelict convoy: occasionally a derelict research convoy appears as a new scavenging site.
-        if rng.random() < 0.02:
+        if derelict_roll < 0.02:
             events.append(("derelict", "A derelict convoy is spotted nearby. It could yield valuable salvage."))
 
         # Process events: record them and notify the player.
@@ -531,7 +872,7 @@ class SurvivalTruckApp(App[Any]):
         # Store events in a unified list under the "events" key.  Each
         # entry records the day, type and description.  Active events
         # persist beyond one day and are separately tracked.
-        events_list: list[dict[str, object]] = self.world_state.setdefault("events", [])  # type: ignore[assignment]
+        events_list = self._events_list
         for event_type, description in events:
             # Append to the persistent events list.  Consumers may
             # dispatch these events into missions or diplomatic effects.
@@ -540,11 +881,14 @@ class SurvivalTruckApp(App[Any]):
                 "type": event_type,
                 "description": description,
             })
-            # Notify the player.
-            context.notify(
-                description,
-                category="event",
-                payload={"type": event_type},
+            # Notify the player; the record also lands on the turn context.
+            context.notifications.append(
+                self._notify(
+                    day=context.day,
+                    message=description,
+                    category="event",
+                    payload={"type": event_type},
+                )
             )
             # Also register the event as active if it persists beyond the
             # current day.  Ambush and caravan events are one-day events,
@@ -552,18 +896,66 @@ class SurvivalTruckApp(App[Any]):
             # compute an expiration day relative to the current day.
             expires_in = 0
             if event_type == "storm":
-                expires_in = 1 + int(rng.random() * 2)
+                expires_in = 1 + int(storm_duration_roll * 2)
             elif event_type == "pandemic":
-                expires_in = 3 + int(rng.random() * 3)
+                expires_in = 3 + int(pandemic_duration_roll * 3)
             elif event_type == "derelict":
                 expires_in = 6
             if expires_in > 0:
                 active_list: list[dict[str, object]] = self.world_state.setdefault("active_events", [])  # type: ignore[assignment]
-                active_list.append({
+                record: dict[str, object] = {
                     "type": event_type,
                     "description": description,
                     "expires": context.day + expires_in,
-                })
+                }
+                active_list.append(record)
+                if active_list is self._active_events_source:
+                    heapq.heappush(
+                        self._active_event_heap,
+                        (context.day + expires_in, next(self._active_event_seq), record),
+                    )
+
+    def _current_cargo_ratio(self) -> float:
+        """Return cargo weight over capacity for the registered truck.
+
+        The ratio is reused until the inventory revision or the truck's weight
+        capacity changes, so quiet turns skip summing every cargo stack.
+        """
+
+        truck = self._truck_ref
+        if truck is None:
+            return 0.0
+        try:
+            inventory = truck.inventory
+            capacity = float(getattr(truck, "weight_capacity", 1.0))
+            revision = getattr(inventory, "revision", None)
+            cached = self._cargo_ratio_cache
+            if (
+                cached is not None
+                and revision is not None
+                and cached[0] is inventory
+                and cached[1] == revision
+                and cached[2] == capacity
+            ):
+                return cached[3]
+            cargo_ratio = getattr(inventory, "total_weight", 0.0) / max(capacity, 1.0)
+        except Exception:
+            return 0.0
+        self._cargo_ratio_cache = (inventory, revision, capacity, cargo_ratio)
+        return cargo_ratio
+
+    def _faction_names(self, controller: Any) -> tuple[str, ...]:
+        """Return the controller's faction names, rebuilt only when the roster changes."""
+
+        ledger = controller.ledger
+        revision = ledger.revision
+        cached = self._faction_names_cache
+        if cached is None or cached[0] is not ledger or cached[1] != revision:
+            # Interned so issuer names stored on missions compare by identity.
+            names = tuple(sys.intern(name) for name in controller.factions)
+            cached = (ledger, revision, names)
+            self._faction_names_cache = cached
+        return cached[2]
 
     def _update_active_events(self, context: TurnContext) -> None:
         """Remove expired active events from the world state.
@@ -580,18 +972,36 @@ class SurvivalTruckApp(App[Any]):
         active_list: list[dict[str, object]] | None = self.world_state.get("active_events")  # type: ignore[assignment]
         if not active_list:
             return
-        remaining: list[dict[str, object]] = []
-        for record in active_list:
-            try:
-                expires = int(record.get("expires", 0))
-            except Exception:
-                expires = 0
-            if expires > context.day:
-                remaining.append(record)
-        # Replace the active events list with remaining events.
-        self.world_state["active_events"] = remaining  # type: ignore[assignment]
+        if (
+            active_list is not self._active_events_source
+            or len(active_list) != len(self._active_event_heap)
+        ):
+            # The list was replaced (e.g. by a restored save) or edited
+            # elsewhere; re-index it.
+            self._index_active_events(active_list)
+        heap = self._active_event_heap
+        if heap and heap[0][0] <= context.day:
+            expired: set[int] = set()
+            while heap and heap[0][0] <= context.day:
+                expired.add(id(heapq.heappop(heap)[2]))
+            # Replace the active events list with remaining events.
+            remaining = [record for record in active_list if id(record) not in expired]
+            self.world_state["active_events"] = remaining
+            self._active_events_source = remaining
         self._update_map_highlights()
 
+    def _index_active_events(self, active_list: list[dict[str, object]]) -> None:
+        heap: list[tuple[int, int, dict[str, object]]] = []
+        for record in active_list:
+            heap.append((self._active_event_expiry(record), next(self._active_event_seq), record))
+        heapq.heapify(heap)
+        self._active_event_heap = heap
+        self._active_events_source = active_list
+
+    @staticmethod
+    def _active_event_expiry(record: Mapping[str, Any]) -> int:
+        return _coerce_expiry(record.get("expires", 0))
+
     # ------------------------------------------------------------------
     def _dispatch_events(self, context: TurnContext) -> None:
         """Process queued world events and produce missions or diplomatic effects.
@@ -610,84 +1020,56 @@ class SurvivalTruckApp(App[Any]):
         Args:
             context: The current turn context providing the day number.
         """
-        raw_events = self.world_state.get("events")
-        if not isinstance(raw_events, list) or not raw_events:
+        raw_events = self._events_list
+        if not raw_events:
             return
         events: list[Mapping[str, object]] = list(raw_events)
         # Access the faction controller to choose mission issuers.
-        faction_controller_component = self.turn_engine.world.get_singleton(
-            FactionControllerComponent
-        )
-        controller = (
-            faction_controller_component.controller
-            if faction_controller_component is not None
-            else None
-        )
-        # Prepare a generator for random selection.  Use a dedicated
-        # stream to ensure deterministic behaviour.
-        event_rng = self.world_randomness.generator("event-dispatch")
-        missions = list(self.world_state.get("missions", []))  # type: ignore[list-item]
-        if controller is None or not controller.factions:
+        controller = self._faction_controller()
+        # Random issuer selection uses a dedicated stream to ensure
+        # deterministic behaviour.
+        event_rng = self._dispatch_rng
+        faction_names = self._faction_names(controller) if controller is not None else ()
+        if not faction_names:
             # No available factions to assign missions; simply clear events.
-            self.world_state["events"] = []  # type: ignore[assignment]
+            raw_events.clear()
             return
-        faction_names = list(controller.factions.keys())
+        # Deduplicate missions by (faction, type, expires).  The dict keeps
+        # the first mission seen for each key and preserves insertion order,
+        # so it doubles as the output list without a parallel seen-set.
+        unique: dict[MissionKey, dict[str, object]] = {}
+        existing = self.world_state.get("missions", [])
+        if isinstance(existing, list):
+            for m, key in zip(existing, self._mission_keys(existing), strict=True):
+                unique.setdefault(key, m)
+        day = context.day
         for ev in events:
             ev_type = str(ev.get("type", ""))
-            # Choose a random faction to issue the mission
+            # Choose a random faction to issue the mission.  Indexing keeps
+            # the interned name; Generator.choice would return numpy.str_.
             try:
-                issuer = event_rng.choice(faction_names)
+                issuer = faction_names[int(event_rng.integers(len(faction_names)))]
             except Exception:
                 issuer = faction_names[0]
-            day = int(getattr(context, "day", self.season_tracker.current_day))
-            if ev_type == "caravan":
-                missions.append({
-                    "faction": issuer,
-                    "type": "escort_caravan_event",
-                    "description": "Escort a travelling caravan spawned by a world event.",
-                    "reward": 15.0,
-                    "expires": day + 5,
-                })
-            elif ev_type == "pandemic":
-                missions.append({
-                    "faction": issuer,
-                    "type": "deliver_aid_event",
-                    "description": "Deliver aid to settlements affected by a spreading illness.",
-                    "reward": 20.0,
-                    "expires": day + 5,
-                })
-            elif ev_type == "storm":
-                missions.append({
-                    "faction": issuer,
-                    "type": "weather_recon_event",
-                    "description": "Gather weather data and assist travellers during an intensifying storm.",
-                    "reward": 10.0,
-                    "expires": day + 4,
-                })
-            elif ev_type == "derelict":
-                missions.append({
-                    "faction": issuer,
-                    "type": "salvage_event",
-                    "description": "Salvage supplies from a derelict convoy spotted nearby.",
-                    "reward": 15.0,
-                    "expires": day + 6,
-                })
+            template = _EVENT_MISSION_TEMPLATES.get(ev_type)
             # Ambush and other events currently do not generate missions.
-        # Deduplicate missions by (faction, type, expires)
-        unique_missions: list[dict[str, object]] = []
-        seen_keys: set[tuple[str, str, int]] = set()
-        for m in missions:
-            fac = str(m.get("faction", ""))
-            typ = str(m.get("type", ""))
-            exp = int(m.get("expires", 0))
-            key = (fac, typ, exp)
-            if key in seen_keys:
+            if template is None:
                 continue
-            seen_keys.add(key)
-            unique_missions.append(m)
-        self.world_state["missions"] = unique_missions  # type: ignore[assignment]
+            mission_type, description, reward, duration = template
+            key = (str(issuer), mission_type, day + duration)
+            if key not in unique:
+                unique[key] = {
+                    "faction": issuer,
+                    "type": mission_type,
+                    "description": description,
+                    "reward": reward,
+                    "expires": day + duration,
+                }
+        missions = list(unique.values())
+        self.world_state["missions"] = missions
+        self._mission_index = (missions, list(unique))
         # Clear processed events
-        self.world_state["events"] = []  # type: ignore[assignment]
+        raw_events.clear()
 
     # ------------------------------------------------------------------
     def _process_expired_missions(self, context: TurnContext) -> None:
@@ -707,34 +1089,47 @@ class SurvivalTruckApp(App[Any]):
         if not isinstance(raw_missions, list) or not raw_missions:
             return
         missions: list[Mapping[str, object]] = list(raw_missions)
-        current_day = int(getattr(context, "day", self.season_tracker.current_day))
-        # Access faction ledger for reputation adjustments
-        faction_controller_component = self.turn_engine.world.get_singleton(
-            FactionControllerComponent
-        )
-        controller = (
-            faction_controller_component.controller
-            if faction_controller_component is not None
-            else None
-        )
+        current_day = context.day
         remaining: list[dict[str, object]] = []
-        for m in missions:
-            exp = int(m.get("expires", current_day))
-            fac_name = str(m.get("faction", ""))
-            m_type = str(m.get("type", ""))
+        remaining_keys: list[MissionKey] = []
+        # Factions issuing surviving event missions, gathered here so the UI
+        # refresh that follows does not rescan the mission list.
+        event_flags: dict[str, bool] = {}
+        # (faction, type) of expired event missions, penalised below.
+        ignored: list[tuple[str, str]] = []
+        keys = self._mission_keys(raw_missions)
+        for m, key in zip(missions, keys, strict=True):
+            fac_name, m_type, exp = key
             if exp > current_day:
                 # Mission still valid; keep it
                 remaining.append(dict(m))
+                remaining_keys.append(key)
+                if fac_name and m_type[_EVENT_SLICE] == _EVENT_SUFFIX:
+                    event_flags[fac_name] = True
                 continue
             # Mission expired: apply penalty if it originated from an event
             # Event-based missions have types ending with "_event"
-            if m_type.endswith("_event") and controller is not None and fac_name in controller.factions:
+            if m_type[_EVENT_SLICE] == _EVENT_SUFFIX:
+                ignored.append((fac_name, m_type))
+
+        # Access faction ledger for reputation adjustments.  The roster is
+        # snapshotted once rather than rebuilt for every expired mission.
+        controller = self._faction_controller() if ignored else None
+        if controller is not None:
+            faction_names = self._faction_names(controller)
+            faction_set = frozenset(faction_names)
+            adjust_reputation = controller.ledger.adjust_reputation
+            record_memory = controller.ledger.record_memory
+            adjust_standing_many = controller.diplomacy.adjust_standing_many
+            for fac_name, m_type in ignored:
+                if fac_name not in faction_set:
+                    continue
                 # Decrease reputation by 5 points
                 try:
                     # Decrease player reputation with the issuing faction.
-                    controller.ledger.adjust_reputation(fac_name, -5.0)
+                    adjust_reputation(fac_name, -5.0)
                     # Record a memory event so future AI decisions can use it.
-                    controller.ledger.record_memory(
+                    record_memory(
                         fac_name,
                         event=f"ignored {m_type}",
                         impact=-5.0,
@@ -745,16 +1140,10 @@ class SurvivalTruckApp(App[Any]):
                     # Ignoring aid erodes trust between factions as well. We apply
                     # a small negative adjustment to the diplomatic standing for
                     # each pair (issuer, other). The adjustment is symmetric.
-                    for other_name in controller.factions.keys():
-                        if other_name == fac_name:
-                            continue
-                        try:
-                            controller.diplomacy.adjust_standing(fac_name, other_name, -0.05)
-                        except Exception:
-                            pass
+                    adjust_standing_many(fac_name, faction_names, -0.05)
                     # Notify the player about both reputation and inter-faction impact.
                     if self.notification_channel is not None:
-                        self.notification_channel.notify(
+                        self._notify(
                             day=current_day,
                             message=(
                                 f"You ignored a mission from {fac_name}. Reputation decreased and their relations"
@@ -766,6 +1155,18 @@ class SurvivalTruckApp(App[Any]):
                     pass
         # Write back the remaining missions
         self.world_state["missions"] = remaining  # type: ignore[assignment]
+        self._mission_index = (remaining, remaining_keys)
+        self._event_flags_cache = (remaining, event_flags)
+
+    def _mission_keys(self, missions: list[Any]) -> list[MissionKey]:
+        """Return the key of each mission, reusing the index built on write."""
+
+        cached = self._mission_index
+        if cached is not None and cached[0] is missions and len(cached[1]) == len(missions):
+            return cached[1]
+        keys = [_mission_key(m) for m in missions]
+        self._mission_index = (missions, keys)
+        return keys
 
     # ------------------------------------------------------------------
     def _process_negotiations(self, context: TurnContext) -> None:
@@ -785,36 +1186,29 @@ class SurvivalTruckApp(App[Any]):
         Args:
             context: The current turn context containing the day counter.
         """
-        negotiations: list[dict[str, object]] = []
+        # Proposals are only read here, so the list is iterated as stored.
         raw = self.world_state.get("negotiations")
-        if isinstance(raw, list):
-            negotiations = [dict(item) for item in raw]
-        current_day = getattr(context, "day", self.season_tracker.current_day)
+        negotiations: Sequence[Mapping[str, object]] = raw if isinstance(raw, list) else []
+        current_day = context.day
 
         # Access the faction controller and ledger to modify reputation.
-        faction_controller_component = self.turn_engine.world.get_singleton(
-            FactionControllerComponent
-        )
-        controller = (
-            faction_controller_component.controller
-            if faction_controller_component is not None
-            else None
-        )
+        controller = self._faction_controller()
         if controller is None:
             # No factions to negotiate with.
             self.world_state["negotiations"] = []  # type: ignore[assignment]
             return
 
-        remaining: list[dict[str, object]] = []
-        for proposal in negotiations:
-            fac_name = str(proposal.get("faction", ""))
-            exp = int(proposal.get("expires", current_day))
-            # Skip proposals for unknown or missing factions.
-            if not fac_name or fac_name not in controller.factions:
-                continue
-            # Remove expired negotiations.
-            if exp <= current_day:
-                continue
+        factions_map = controller.factions
+        faction_set = frozenset(factions_map)
+        # Proposals from unknown factions, or without a future expiry, are
+        # dropped without being applied.
+        to_apply = [
+            proposal
+            for proposal in negotiations
+            if str(proposal.get("faction", "")) in faction_set
+            and _coerce_expiry(proposal.get("expires")) > current_day
+        ]
+        for proposal in to_apply:
             # Determine automatic acceptance policy. For demonstration we
             # accept non-negative proposals (net >= 0) and decline
             # negative ones. Net is reward minus demand.
@@ -823,10 +1217,15 @@ class SurvivalTruckApp(App[Any]):
             net = reward - demand
             accepted = net >= 0
             # Apply effects and notify.
-            self._apply_negotiation_effect(context=context, proposal=proposal, accepted=accepted)
-            # Negotiation is consumed regardless of acceptance.
-            # Do not append to remaining.
-        # Clear all negotiations after processing.
+            self._apply_negotiation_effect(
+                context=context,
+                proposal=proposal,
+                accepted=accepted,
+                controller=controller,
+                factions=factions_map,
+            )
+        # Every negotiation is consumed regardless of acceptance, so the
+        # list is cleared after processing.
         self.world_state["negotiations"] = []  # type: ignore[assignment]
 
     def _apply_negotiation_effect(
@@ -835,6 +1234,8 @@ class SurvivalTruckApp(App[Any]):
         context: TurnContext,
         proposal: Mapping[str, object],
         accepted: bool,
+        controller: FactionAIController | None = None,
+        factions: Mapping[str, FactionRecord] | None = None,
     ) -> None:
         """Apply the outcome of a negotiation proposal.
 
@@ -847,21 +1248,23 @@ class SurvivalTruckApp(App[Any]):
             proposal: The negotiation mapping containing details of the
                 proposal (faction, type, demand, reward, expires).
             accepted: True if the proposal was accepted, False if declined.
+            controller: The faction controller already resolved by the
+                caller; looked up when omitted.
+            factions: The caller's snapshot of ``controller.factions``;
+                rebuilt when omitted.
         """
         faction_name = str(proposal.get("faction", ""))
         if not faction_name:
             return
-        faction_controller_component = self.turn_engine.world.get_singleton(
-            FactionControllerComponent
-        )
-        controller = (
-            faction_controller_component.controller
-            if faction_controller_component is not None
-            else None
-        )
-        if controller is None or faction_name not in controller.factions:
+        if controller is None:
+            controller = self._faction_controller()
+        if controller is None:
+            return
+        if factions is None:
+            factions = controller.factions
+        faction = factions.get(faction_name)
+        if faction is None:
             return
-        faction = controller.factions[faction_name]
         demand = float(proposal.get("demand", 0.0) or 0.0)
         reward = float(proposal.get("reward", 0.0) or 0.0)
         n_type = str(proposal.get("type", ""))
@@ -881,6 +1284,7 @@ class SurvivalTruckApp(App[Any]):
             rep_delta = -max(1.0, demand * 0.1)
         # Apply reputation change.
         new_rep = faction.adjust_reputation(rep_delta)
+        day = context.day
         # Record a memory event for this negotiation. We use a modest
         # decay rate so that the effect lingers for some time.
         ledger = controller.ledger
@@ -889,7 +1293,7 @@ class SurvivalTruckApp(App[Any]):
                 faction_name,
                 event=f"negotiation:{n_type}",
                 impact=rep_delta,
-                day=getattr(context, "day", self.season_tracker.current_day),
+                day=day,
                 decay_rate=0.02,
             )
         except Exception:
@@ -902,8 +1306,8 @@ class SurvivalTruckApp(App[Any]):
                 f"You {outcome} a {n_type} proposal from {faction_name} (net {net:+.0f})."
                 f" Reputation now {new_rep:+.1f}."
             )
-            self.notification_channel.notify(
-                day=getattr(context, "day", self.season_tracker.current_day),
+            self._notify(
+                day=day,
                 message=message,
                 payload={"faction": faction_name, "type": n_type, "accepted": accepted},
             )
@@ -921,26 +1325,29 @@ class SurvivalTruckApp(App[Any]):
 
     # ------------------------------------------------------------------
     def _refresh_ui(self, *, context: TurnContext | None = None) -> None:
+        # Every panel below is updated before the screen repaints once.
+        with self.batch_update():
+            self._refresh_panels(context)
+
+    def _refresh_panels(self, context: TurnContext | None) -> None:
+        from ..engine.world import TruckComponent
+        from ..truck import Truck
+
         self._refresh_map_view()
         self._update_map_highlights()
 
         truck_component = self.turn_engine.world.get_singleton(TruckComponent)
         truck = truck_component.truck if truck_component is not None else None
-        self.truck_view.set_truck(truck if isinstance(truck, Truck) else None)
+        if not isinstance(truck, Truck):
+            truck = None
+        self.truck_view.set_truck(truck)
 
-        stats = self._build_stats(context)
+        stats = self._build_stats(context, truck)
         self.dashboard.update_stats(stats)
         if context is None:
             self.dashboard.set_focus_detail(None)
 
-        faction_controller_component = self.turn_engine.world.get_singleton(
-            FactionControllerComponent
-        )
-        controller = (
-            faction_controller_component.controller
-            if faction_controller_component is not None
-            else None
-        )
+        controller = self._faction_controller()
         if controller is not None:
             graph = controller.diplomacy.as_graph(controller.factions.keys())
             factions = controller.factions
@@ -951,35 +1358,24 @@ class SurvivalTruckApp(App[Any]):
         # proposals are generated by the FactionAIController and stored as a list
         # of mapping objects under the "negotiations" key. See diplomacy.py
         # for display details.
+        # The diplomacy view only reads the proposals, so the stored list is
+        # handed over without copying each mapping.
         negotiations = self.world_state.get("negotiations", [])
-        try:
-            seq_negotiations: Sequence[Mapping[str, object]] | None
-            if isinstance(negotiations, Sequence):
-                # Ensure we only pass sequence types (e.g. list of dicts).
-                seq_negotiations = [dict(item) for item in negotiations]  # type: ignore[misc]
-            else:
-                seq_negotiations = None
-        except Exception:
-            seq_negotiations = None
+        seq_negotiations: Sequence[Mapping[str, object]] | None = (
+            negotiations if isinstance(negotiations, list) else None
+        )
         # Determine which factions are currently linked to world events via
         # event-generated missions.  Missions originating from world
         # events have types ending with "_event" and include a
         # ``faction`` field indicating the issuer.  We build a mapping of
         # faction names to True for highlighting in the diplomacy panel.
-        event_flags: dict[str, bool] = {}
-        try:
-            raw_missions = self.world_state.get("missions")
-            if isinstance(raw_missions, Sequence):
-                for m in raw_missions:
-                    try:
-                        m_type = str(m.get("type", ""))
-                        fac = str(m.get("faction", ""))
-                    except Exception:
-                        continue
-                    if m_type.endswith("_event") and fac:
-                        event_flags[fac] = True
-        except Exception:
-            event_flags = {}
+        raw_missions = self.world_state.get("missions")
+        cached_flags = self._event_flags_cache
+        if cached_flags is not None and cached_flags[0] is raw_missions:
+            # The expiry pass already flagged the factions for this list.
+            event_flags = cached_flags[1]
+        else:
+            event_flags = self._scan_event_flags(raw_missions)
         self.diplomacy_view.update_snapshot(
             factions=factions,
             graph=graph,
@@ -990,60 +1386,82 @@ class SurvivalTruckApp(App[Any]):
         self.log_widget.refresh_from_channel()
         self.control_widget.refresh_from_panel()
 
+    @staticmethod
+    def _scan_event_flags(raw_missions: object) -> dict[str, bool]:
+        event_flags: dict[str, bool] = {}
+        if not isinstance(raw_missions, list):
+            return event_flags
+        for m in raw_missions:
+            if not isinstance(m, Mapping):
+                continue
+            m_type = str(m.get("type", ""))
+            fac = str(m.get("faction", ""))
+            if m_type[_EVENT_SLICE] == _EVENT_SUFFIX and fac:
+                event_flags[fac] = True
+        return event_flags
+
+    def _sync_map_shape(self) -> None:
+        widths = {len(row) for row in self._map_data}
+        self._map_rows = len(self._map_data)
+        self._map_cols = max(widths, default=0)
+        self._map_ragged = len(widths) > 1
+
     def _refresh_map_view(self) -> None:
-        rows = len(self._map_data)
-        cols = max((len(row) for row in self._map_data), default=0)
+        cached = self._canvas_payload
+        if cached is not None and cached[0] is self._map_data:
+            # The canvas already holds the payload for this grid.
+            return
+        self._sync_map_shape()
         tiles, labels = self._build_canvas_payload(self._map_data)
-        self.map_view.cols = cols
-        self.map_view.rows = rows
+        self.map_view.cols = self._map_cols
+        self.map_view.rows = self._map_rows
         self.map_view.set_tiles(tiles)
         self.map_view.set_labels(labels)
 
     def _update_map_highlights(self) -> None:
-        highlights: dict[tuple[int, int], str] = {}
-        for index, waypoint in enumerate(self.control_panel.route_waypoints):
-            try:
-                row_str, col_str = waypoint.split(",", 1)
-                row = int(row_str)
-                col = int(col_str)
-            except ValueError:
-                continue
-            if not self._in_bounds(row, col):
-                continue
-            label = f"[yellow]{index + 1:02}[/yellow]"
-            highlights[(col, row)] = label
+        # Several handlers fire without the staged route changing; only push
+        # new highlights to the canvas when the waypoint sequence differs.
+        route = self.control_panel.route_waypoints
+        if route == self._highlighted_route:
+            return
+        in_bounds = self._in_bounds
+        highlights = {
+            (col, row): _waypoint_label(index)
+            for index, (row, col) in enumerate(route, start=1)
+            if in_bounds(row, col)
+        }
         self.map_view.set_highlights(highlights)
+        self._highlighted_route = route
 
     def _build_canvas_payload(
         self, grid: Sequence[Sequence[str]]
     ) -> tuple[dict[tuple[int, int], str], dict[tuple[int, int], str]]:
-        tiles: dict[tuple[int, int], str] = {}
-        labels: dict[tuple[int, int], str] = {}
-        for row_index, row in enumerate(grid):
-            for col_index, terrain in enumerate(row):
-                terrain_text = str(terrain)
-                tiles[(col_index, row_index)] = self._terrain_code_for(terrain_text)
-                labels[(col_index, row_index)] = self._terrain_symbol_for(terrain_text)
+        import numpy as np
+
+        cached = self._canvas_payload
+        if cached is not None and cached[0] is grid:
+            return cached[1], cached[2]
+        coords = [(col, row) for row, cells in enumerate(grid) for col in range(len(cells))]
+        if not coords:
+            self._canvas_payload = (grid, {}, {})
+            return {}, {}
+        # Resolve each distinct terrain once, then gather the per-cell values
+        # through lookup arrays instead of calling the helpers for every cell.
+        names = np.array([str(terrain) for cells in grid for terrain in cells], dtype=np.str_)
+        unique, inverse = np.unique(names, return_inverse=True)
+        distinct = unique.tolist()
+        code_lut = np.array([self._terrain_code_for(name) for name in distinct], dtype=np.str_)
+        symbol_lut = np.array([self._terrain_symbol_for(name) for name in distinct], dtype=np.str_)
+        tiles = dict(zip(coords, code_lut[inverse].tolist(), strict=True))
+        labels = dict(zip(coords, symbol_lut[inverse].tolist(), strict=True))
+        self._canvas_payload = (grid, tiles, labels)
         return tiles, labels
 
     def _terrain_symbol_for(self, terrain: str) -> str:
-        trimmed = terrain.strip()
-        if not trimmed:
-            return "??"
-        normalised = trimmed.lower()
-        symbol = self._terrain_symbols.get(normalised)
-        if symbol:
-            return symbol
-        if len(trimmed) == 1:
-            return trimmed.upper()
-        return trimmed[:2].title()
+        return _terrain_symbol(terrain)
 
     def _terrain_code_for(self, terrain: str) -> str:
-        trimmed = terrain.strip()
-        if not trimmed:
-            return "Sc"
-        normalised = trimmed.lower()
-        return self._terrain_fill_codes.get(normalised, "Sc")
+        return _terrain_code(terrain)
 
     def _terrain_at(self, row: int, col: int) -> str | None:
         if not self._in_bounds(row, col):
@@ -1051,14 +1469,12 @@ class SurvivalTruckApp(App[Any]):
         return str(self._map_data[row][col])
 
     def _in_bounds(self, row: int, col: int) -> bool:
-        if row < 0 or col < 0:
+        if not (0 <= row < self._map_rows and 0 <= col < self._map_cols):
             return False
-        if row >= len(self._map_data):
-            return False
-        row_data = self._map_data[row]
-        return col < len(row_data)
+        # Only ragged grids need the per-row width check.
+        return not self._map_ragged or col < len(self._map_data[row])
 
-    def _build_stats(self, context: TurnContext | None) -> dict[str, str]:
+    def _build_stats(self, context: TurnContext | None, truck: Truck | None) -> dict[str, str]:
         """Construct a dictionary of campaign statistics for the dashboard.
 
         In addition to basic information about the day, season and truck
@@ -1071,13 +1487,16 @@ class SurvivalTruckApp(App[Any]):
         Args:
             context: The current turn context, or ``None`` if no turn has
                 been processed yet.
+            truck: The truck resolved by the caller for this refresh, if any.
 
         Returns:
             A mapping of statistic names to string representations.
         """
+        from ..truck.inventory import Inventory
+
         stats: dict[str, str] = {
             "Day": str(self.season_tracker.current_day),
-            "Season": self.season_tracker.current_season.name.title(),
+            "Season": self._season_label,
         }
         # Include a countdown to the next season change so players can
         # anticipate upcoming shifts in environmental modifiers.  Use a
@@ -1089,14 +1508,13 @@ class SurvivalTruckApp(App[Any]):
         except Exception:
             pass
 
-        truck_component = self.turn_engine.world.get_singleton(TruckComponent)
-        truck = truck_component.truck if truck_component is not None else None
-        if isinstance(truck, Truck):
+        if truck is not None:
+            inventory = truck.inventory
             stats["Truck"] = f"{truck.condition:.0%} condition"
             stats["Crew"] = f"{truck.current_crew_workload}/{truck.crew_capacity}"
             stats["Cargo"] = (
-                f"{truck.inventory.total_weight:.0f}kg / {truck.weight_capacity:.0f}kg"
-                if isinstance(truck.inventory, Inventory)
+                f"{inventory.total_weight:.0f}kg / {truck.weight_capacity:.0f}kg"
+                if isinstance(inventory, Inventory)
                 else "0"
             )
         if context is None:
@@ -1108,11 +1526,10 @@ class SurvivalTruckApp(App[Any]):
         # weather condition and modifiers, and ``world_state["last_travel_cost"]``
         # with the adjusted and base travel costs.  Present these values on
         # the campaign stats panel so players can see environmental pressures.
-        weather_record: Any | None = None
-        try:
-            weather_record = context.world_state.get("weather")
-        except Exception:
-            weather_record = None
+        world_state = context.world_state
+        if not isinstance(world_state, Mapping):
+            world_state = {}
+        weather_record = world_state.get("weather")
         if isinstance(weather_record, dict):
             condition = weather_record.get("condition")
             travel_mod = weather_record.get("travel_modifier")
@@ -1123,11 +1540,7 @@ class SurvivalTruckApp(App[Any]):
                 except Exception:
                     stats["Weather"] = str(condition).title()
 
-        last_travel: Any | None = None
-        try:
-            last_travel = context.world_state.get("last_travel_cost")
-        except Exception:
-            last_travel = None
+        last_travel = world_state.get("last_travel_cost")
         if isinstance(last_travel, dict):
             adjusted = last_travel.get("adjusted_cost")
             base_cost = last_travel.get("base_cost")
@@ -1177,13 +1590,18 @@ class SurvivalTruckApp(App[Any]):
 
     @staticmethod
     def _summarise_layout_config(config: HexLayoutConfig) -> dict[str, str]:
-        return {
-            "Orientation": config.orientation.title(),
-            "Hex Height": f"{config.hex_height:.1f}",
-            "Flatten": f"{config.flatten:.2f}",
-            "Origin": f"({config.origin_x:.1f}, {config.origin_y:.1f})",
-            "Offset": config.offset_mode,
-        }
+        # The config object is edited in place, so the formatted rows are
+        # memoised on its field values; callers still get their own dict.
+        return dict(
+            _layout_summary_rows(
+                config.orientation,
+                config.hex_height,
+                config.flatten,
+                config.origin_x,
+                config.origin_y,
+                config.offset_mode,
+            )
+        )
 
     def on_hex_canvas_layout_config_changed(
         self, event: HexCanvas.LayoutConfigChanged
@@ -1255,31 +1673,16 @@ class SurvivalTruckApp(App[Any]):
                 )
 
     @staticmethod
-    def _bindings_for(target: object) -> list[Binding]:
-        bindings: list[Binding] = []
-        candidate = getattr(target, "BINDINGS", None)
-        if isinstance(candidate, Sequence):
-            for binding in candidate:
-                if isinstance(binding, Binding):
-                    bindings.append(binding)
-        return bindings
+    def _bindings_for(target: object) -> tuple[Binding, ...]:
+        # typeshed's ``type.__hash__`` does not satisfy the cache wrapper's
+        # Hashable parameter, so the class is passed through as Any.
+        cls: Any = type(target)
+        return _cached_bindings(cls)
 
     # ------------------------------------------------------------------
     @staticmethod
     def _create_demo_config(size: int = 9, seed: int = 42) -> AppConfig:
-        randomness = WorldRandomness(seed=seed)
-        noise = BiomeNoise(randomness=randomness)
-        center = HexCoord(0, 0)
-        half = size // 2
-        grid: list[list[str]] = []
-        for r in range(-half, half + 1):
-            row: list[str] = []
-            for q in range(-half, half + 1):
-                coord = HexCoord(center.q + q, center.r + r)
-                biome = noise.biome(coord)
-                name = biome.value if hasattr(biome, "value") else str(biome)
-                row.append(name)
-            grid.append(row)
+        grid = [list(row) for row in _compute_demo_grid(size, seed)]
         world_state: MutableMapping[str, object] = {
             "truck": SurvivalTruckApp._create_demo_truck(),
         }
@@ -1287,6 +1690,9 @@ class SurvivalTruckApp(App[Any]):
 
     @staticmethod
     def _create_demo_truck() -> Truck:
+        from ..truck import Dimensions, Truck, TruckModule
+        from ..truck.inventory import Inventory, InventoryItem, ItemCategory
+
         truck = Truck(
             name="Nomad Mk I",
             module_capacity=Dimensions(length=4, width=2, height=2),
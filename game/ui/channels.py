@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
+from itertools import islice
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from rich import box
@@ -17,7 +20,7 @@ if TYPE_CHECKING:
     from ..engine.turn_engine import TurnContext
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """High level summary of a completed turn."""
 
@@ -28,18 +31,37 @@ class LogEntry:
     scheduled: list[str] = field(default_factory=list)
 
 
-@dataclass
+# Shared read-only payload for records raised without extra details, so the
+# notification history does not hold one empty dict per record.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class NotificationRecord:
     """Light-weight notification for surfacing events to the UI."""
 
     day: int
     message: str
     category: str = "info"
-    payload: dict[str, Any] = field(default_factory=dict)
+    payload: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_PAYLOAD)
+    # Records are not edited once pushed, so the rendered line is kept.
+    _brief: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.payload:
+            self.payload = _EMPTY_PAYLOAD
 
     def format_brief(self) -> str:
-        payload_bits = [f"{key}={value}" for key, value in self.payload.items()]
-        payload_text = f" ({', '.join(payload_bits)})" if payload_bits else ""
+        if self._brief is None:
+            self._brief = self._build_brief()
+        return self._brief
+
+    def _build_brief(self) -> str:
+        if not self.payload:
+            payload_text = ""
+        else:
+            payload_bits = ", ".join(f"{key}={value}" for key, value in self.payload.items())
+            payload_text = f" ({payload_bits})"
         return f"[{self.category}] Day {self.day}: {self.message}{payload_text}"
 
 
@@ -48,16 +70,23 @@ class TurnLogChannel:
 
     def __init__(self, *, max_entries: int = 100) -> None:
         self.max_entries = max_entries
-        self._entries: list[LogEntry] = []
+        # Bounded so the oldest entry is evicted on append without copying.
+        self._entries: deque[LogEntry] = deque(maxlen=max_entries)
+        # Tuple handed out by ``entries``; rebuilt only after a push.
+        self._snapshot: tuple[LogEntry, ...] | None = None
+        # Last rendered panel keyed by title; dropped whenever entries change.
+        self._render_cache: tuple[str, RenderableType] | None = None
 
     @property
     def entries(self) -> Sequence[LogEntry]:
-        return tuple(self._entries)
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entries)
+        return self._snapshot
 
     def push(self, entry: LogEntry) -> None:
         self._entries.append(entry)
-        if len(self._entries) > self.max_entries:
-            self._entries = self._entries[-self.max_entries :]
+        self._snapshot = None
+        self._render_cache = None
 
     def record_context(self, context: TurnContext, *, summary: str | None = None) -> LogEntry:
         """Create a log entry from the provided turn context."""
@@ -80,6 +109,9 @@ class TurnLogChannel:
     def render_table(self, *, title: str = "Turn Log") -> RenderableType:
         """Return a Rich renderable summarising recent log entries."""
 
+        cached = self._render_cache
+        if cached is not None and cached[0] == title:
+            return cached[1]
         table = Table(title=title, expand=True, box=box.SIMPLE_HEAVY)
         table.add_column("Day", justify="right", no_wrap=True)
         table.add_column("Summary", overflow="fold")
@@ -92,7 +124,9 @@ class TurnLogChannel:
             event_text = "\n".join(event_lines) if event_lines else "—"
             table.add_row(str(entry.day), entry.summary, highlight_text, event_text)
 
-        return Panel(table, title=title, border_style="yellow")
+        panel = Panel(table, title=title, border_style="yellow")
+        self._render_cache = (title, panel)
+        return panel
 
 
 class NotificationChannel:
@@ -100,16 +134,25 @@ class NotificationChannel:
 
     def __init__(self, *, max_entries: int = 200) -> None:
         self.max_entries = max_entries
-        self._notifications: list[NotificationRecord] = []
+        self._notifications: deque[NotificationRecord] = deque(maxlen=max_entries)
+        # Tuple handed out by ``notifications``; rebuilt only after a change.
+        self._snapshot: tuple[NotificationRecord, ...] | None = None
+        self._render_cache: tuple[str, RenderableType] | None = None
 
     @property
     def notifications(self) -> Sequence[NotificationRecord]:
-        return tuple(self._notifications)
+        if self._snapshot is None:
+            self._snapshot = tuple(self._notifications)
+        return self._snapshot
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._notifications
 
     def push(self, notification: NotificationRecord) -> None:
         self._notifications.append(notification)
-        if len(self._notifications) > self.max_entries:
-            self._notifications = self._notifications[-self.max_entries :]
+        self._snapshot = None
+        self._render_cache = None
 
     def notify(
         self,
@@ -120,58 +163,72 @@ class NotificationChannel:
         payload: Mapping[str, Any] | None = None,
     ) -> NotificationRecord:
         record = NotificationRecord(
-            day=day, message=message, category=category, payload=dict(payload or {})
+            day=day,
+            message=message,
+            category=category,
+            payload=dict(payload) if payload else _EMPTY_PAYLOAD,
         )
         self.push(record)
         return record
 
+    def push_many(self, notifications: Iterable[NotificationRecord]) -> None:
+        """Append several notifications; the bounded history evicts as it goes."""
+
+        self._notifications.extend(notifications)
+        self._snapshot = None
+        self._render_cache = None
+
     def extend_from_events(self, day: int, events: Iterable[QueuedEvent]) -> None:
-        for event in events:
-            payload = dict(event.payload)
-            message = str(payload.pop("message", event.event_type.replace("_", " ").title()))
-            payload.setdefault("event_type", event.event_type)
-            payload.setdefault("scheduled_for", event.day)
-            self.push(
-                NotificationRecord(
-                    day=day,
-                    message=message,
-                    category="event",
-                    payload=payload,
-                )
-            )
+        self.push_many([_event_notification(day, event) for event in events])
 
     def extend_from_schedule(self, scheduled: Iterable[QueuedEvent]) -> None:
-        for event in scheduled:
-            payload = dict(event.payload)
-            payload.setdefault("event_type", event.event_type)
-            payload.setdefault("scheduled_for", event.day)
-            self.push(
-                NotificationRecord(
-                    day=event.day,
-                    message=f"Scheduled {event.event_type}",
-                    category="schedule",
-                    payload=payload,
-                )
-            )
+        self.push_many([_scheduled_notification(event) for event in scheduled])
 
     def clear(self) -> None:
         """Remove all stored notifications."""
 
         self._notifications.clear()
+        self._snapshot = None
+        self._render_cache = None
 
     def render_panel(self, *, title: str = "Notifications") -> RenderableType:
+        cached = self._render_cache
+        if cached is not None and cached[0] == title:
+            return cached[1]
         table = Table(expand=True)
         table.add_column("Day", justify="right", no_wrap=True)
         table.add_column("Category", no_wrap=True)
         table.add_column("Message", overflow="fold")
 
-        for record in reversed(self._notifications[-10:]):
+        for record in islice(reversed(self._notifications), 10):
             table.add_row(str(record.day), record.category, record.format_brief())
 
-        return Panel(table, title=title, border_style="magenta")
+        panel = Panel(table, title=title, border_style="magenta")
+        self._render_cache = (title, panel)
+        return panel
 
 
 # ---------------------------------------------------------------------------
+def _event_notification(day: int, event: QueuedEvent) -> NotificationRecord:
+    payload = dict(event.payload)
+    message = str(payload.pop("message", event.event_type.replace("_", " ").title()))
+    payload.setdefault("event_type", event.event_type)
+    payload.setdefault("scheduled_for", event.day)
+    return NotificationRecord(day=day, message=message, category="event", payload=payload)
+
+
+def _scheduled_notification(event: QueuedEvent) -> NotificationRecord:
+    payload = dict(event.payload)
+    payload.setdefault("event_type", event.event_type)
+    payload.setdefault("scheduled_for", event.day)
+    return NotificationRecord(
+        day=event.day,
+        message=f"Scheduled {event.event_type}",
+        category="schedule",
+        payload=payload,
+    )
+
+
 def _format_event_line(event: QueuedEvent) -> str:
     payload = ", ".join(f"{key}={value}" for key, value in event.payload.items())
     if payload:
@@ -47,12 +47,17 @@ def _compute_config_path() -> Path:
         return fallback_dir / config_filename
 
 
+def _encode(data: Dict[str, Any]) -> str:
+    """Serialise ``data`` compactly; the file is tiny and rewritten often."""
+    return json.dumps(data, separators=(",", ":"))
+
+
 # Compute the configuration path at import time.  Other modules may
 # import CONFIG_PATH to refer to the resolved file location.
 CONFIG_PATH: Path = _compute_config_path()
 
 
-@dataclass
+@dataclass(slots=True)
 class HexLayoutConfig:
     """Dataclass representing the adjustable parameters of the hex grid.
 
@@ -93,21 +98,19 @@ class HexLayoutConfig:
         if path.exists():
             try:
                 data = json.loads(path.read_text())
-                # Merge defaults with persisted values so any new
-                # attributes are initialised to sensible defaults.  Do
-                # not pass through private attributes like ``dirty``.
-                merged: Dict[str, Any] = {**cls().__dict__}
-                merged.update(data)
-                # Load persisted values, clamping flatten into the allowed range.
-                flatten_val = float(merged.get("flatten", 0.55))
+                # Each field is read explicitly with its class default, so
+                # missing attributes fall back sensibly and private ones
+                # like ``dirty`` are never taken from the file.  Flatten is
+                # clamped into the allowed range.
+                flatten_val = float(data.get("flatten", 0.55))
                 flatten_val = min(max(flatten_val, 0.30), 1.10)
                 inst = cls(
-                    orientation=merged.get("orientation", "pointy"),
-                    hex_height=float(merged.get("hex_height", 36.0)),
+                    orientation=data.get("orientation", "pointy"),
+                    hex_height=float(data.get("hex_height", 36.0)),
                     flatten=flatten_val,
-                    origin_x=float(merged.get("origin_x", 8.0)),
-                    origin_y=float(merged.get("origin_y", 8.0)),
-                    offset_mode=str(merged.get("offset_mode", "odd-r")),
+                    origin_x=float(data.get("origin_x", 8.0)),
+                    origin_y=float(data.get("origin_y", 8.0)),
+                    offset_mode=str(data.get("offset_mode", "odd-r")),
                 )
                 inst.dirty = False
                 return inst
@@ -120,7 +123,7 @@ class HexLayoutConfig:
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
             temp_path = path.with_suffix(path.suffix + ".tmp")
-            temp_path.write_text(json.dumps(inst.to_dict(), indent=2))
+            temp_path.write_text(_encode(inst.to_dict()))
             temp_path.replace(path)
         except Exception:
             # If writing fails, swallow the error – the in‑memory
@@ -138,7 +141,7 @@ class HexLayoutConfig:
         file.
         """
         path = CONFIG_PATH
-        data = json.dumps(self.to_dict(), indent=2)
+        data = _encode(self.to_dict())
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
             temp_path = path.with_suffix(path.suffix + ".tmp")
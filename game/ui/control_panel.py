@@ -20,6 +20,20 @@ from textual.binding import Binding
 from textual.message import Message
 from textual.widget import Widget
 
+# Staged route points are ``(row, col)`` map coordinates.
+Waypoint = tuple[int, int]
+
+
+def _coerce_waypoint(point: Waypoint | str) -> Waypoint:
+    if isinstance(point, str):
+        row_str, col_str = point.split(",", 1)
+        return int(row_str), int(col_str)
+    return int(point[0]), int(point[1])
+
+
+def _format_waypoint(point: Waypoint) -> str:
+    return f"{point[0]},{point[1]}"
+
 
 @dataclass
 class ControlPanel:
@@ -31,27 +45,46 @@ class ControlPanel:
     exposing higher level conveniences for callers.
     """
 
-    _route_waypoints: list[str] = field(default_factory=list)
+    _route_waypoints: list[Waypoint] = field(default_factory=list)
     _module_orders: dict[str, str] = field(default_factory=dict)
     _crew_assignments: dict[str, str] = field(default_factory=dict)
+    # Last rendered panel keyed by title and the last built command payload;
+    # every mutator drops both through ``_invalidate``.
+    _render_cache: tuple[str, RenderableType] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _payload_cache: dict[str, object] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _invalidate(self) -> None:
+        self._render_cache = None
+        self._payload_cache = None
 
     # ------------------------------------------------------------------
-    def plan_route(self, waypoints: Iterable[str]) -> None:
-        """Replace the current route with the provided waypoint sequence."""
+    def plan_route(self, waypoints: Iterable[Waypoint | str]) -> None:
+        """Replace the current route with the provided waypoint sequence.
 
-        self._route_waypoints = [str(point) for point in waypoints]
+        Waypoints are ``(row, col)`` pairs; ``"row,col"`` strings are parsed
+        on the way in so the staged route always holds integer tuples.
+        """
+
+        self._route_waypoints = [_coerce_waypoint(point) for point in waypoints]
+        self._invalidate()
 
-    def append_waypoint(self, waypoint: str) -> None:
-        self._route_waypoints.append(str(waypoint))
+    def append_waypoint(self, waypoint: Waypoint | str) -> None:
+        self._route_waypoints.append(_coerce_waypoint(waypoint))
+        self._invalidate()
 
     def clear_route(self) -> None:
         self._route_waypoints.clear()
+        self._invalidate()
 
     @property
-    def route_waypoints(self) -> list[str]:
-        """Expose a copy of the currently staged route."""
+    def route_waypoints(self) -> tuple[Waypoint, ...]:
+        """Expose a read-only snapshot of the currently staged route."""
 
-        return list(self._route_waypoints)
+        return tuple(self._route_waypoints)
 
     # ------------------------------------------------------------------
     def set_module_state(self, module_id: str, action: str) -> None:
@@ -63,28 +96,45 @@ class ControlPanel:
         management.
         """
 
-        self._module_orders[str(module_id)] = str(action)
+        self._module_orders[module_id if type(module_id) is str else str(module_id)] = (
+            action if type(action) is str else str(action)
+        )
+        self._invalidate()
 
     def clear_module_orders(self) -> None:
         self._module_orders.clear()
+        self._invalidate()
 
     # ------------------------------------------------------------------
     def assign_crew(self, member: str, task: str) -> None:
         """Record a lightweight crew assignment for the upcoming turn."""
 
-        key = str(member)
-        self._crew_assignments[key] = str(task)
+        key = member if type(member) is str else str(member)
+        self._crew_assignments[key] = task if type(task) is str else str(task)
+        self._invalidate()
 
     def clear_crew(self) -> None:
         self._crew_assignments.clear()
+        self._invalidate()
 
     # ------------------------------------------------------------------
     def build_command_payload(self) -> dict[str, object]:
-        """Return a dictionary that can be passed to the turn engine."""
+        """Return a dictionary that can be passed to the turn engine.
+
+        The payload is rebuilt only after the plan changes.  Callers get their
+        own top-level dict, but the nested entries are shared and read-only.
+        """
+
+        if self._payload_cache is None:
+            self._payload_cache = self._build_payload()
+        return dict(self._payload_cache)
 
+    def _build_payload(self) -> dict[str, object]:
         payload: dict[str, object] = {}
         if self._route_waypoints:
-            payload["route"] = {"waypoints": list(self._route_waypoints)}
+            payload["route"] = {
+                "waypoints": [_format_waypoint(point) for point in self._route_waypoints]
+            }
         if self._module_orders:
             payload["module_orders"] = [
                 {"module_id": module_id, "action": action}
@@ -108,8 +158,16 @@ class ControlPanel:
 
     # ------------------------------------------------------------------
     def render(self, *, title: str | None = None) -> RenderableType:
+        title = title or "Turn Controls"
+        cached = self._render_cache
+        if cached is not None and cached[0] == title:
+            return cached[1]
         table = Table.grid(padding=(0, 1), expand=True)
-        route = " -> ".join(self._route_waypoints) if self._route_waypoints else "(no route)"
+        route = (
+            " -> ".join(_format_waypoint(point) for point in self._route_waypoints)
+            if self._route_waypoints
+            else "(no route)"
+        )
         table.add_row("[bold]Route[/bold]", route)
 
         if self._module_orders:
@@ -124,7 +182,9 @@ class ControlPanel:
         else:
             table.add_row("[bold]Crew[/bold]", "(no assignments)")
 
-        return Panel(table, title=title or "Turn Controls", border_style="white")
+        panel = Panel(table, title=title, border_style="white")
+        self._render_cache = (title, panel)
+        return panel
 
 
 class ControlPanelWidget(Widget):
@@ -165,4 +225,4 @@ class ControlPanelWidget(Widget):
         self.post_message(self.PlanUpdated())
 
 
-__all__ = ["ControlPanel", "ControlPanelWidget"]
\ No newline at end of file
+__all__ = ["ControlPanel", "ControlPanelWidget", "Waypoint"]
\ No newline at end of file
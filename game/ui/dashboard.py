@@ -3,20 +3,39 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 
 from rich.console import RenderableType
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from textual.binding import Binding
 from textual.widget import Widget
 
 from .channels import NotificationChannel, TurnLogChannel
 
 
+def _stringify(mapping: Mapping[str, str]) -> dict[str, str]:
+    """Copy ``mapping``, coercing only the keys and values that are not ``str``."""
+
+    # The app already hands over strings, so ``str()`` is skipped for them.
+    return {
+        key if type(key) is str else str(key): value if type(value) is str else str(value)
+        for key, value in mapping.items()
+    }
+
+
 def _build_stats_panel(stats: Mapping[str, str]) -> RenderableType:
+    return _stats_panel_for(tuple(stats.items()))
+
+
+# Panels are memoised on their rows, so re-rendering the same stats or layout
+# summary (e.g. after a focus change) reuses the existing renderable.
+@lru_cache(maxsize=32)
+def _stats_panel_for(items: tuple[tuple[str, str], ...]) -> RenderableType:
     table = Table.grid(padding=(0, 1), expand=True)
-    for key, value in stats.items():
+    for key, value in items:
         table.add_row(f"[bold]{key}[/bold]", str(value))
     return Panel(table, title="Campaign Stats", border_style="blue")
 
@@ -37,8 +56,13 @@ def _build_layout_panel(config: Mapping[str, str], *, unsaved: bool = False) ->
     Returns:
         RenderableType: A Panel containing the configuration summary.
     """
+    return _layout_panel_for(tuple(config.items()), unsaved)
+
+
+@lru_cache(maxsize=32)
+def _layout_panel_for(items: tuple[tuple[str, str], ...], unsaved: bool) -> RenderableType:
     table = Table.grid(padding=(0, 1), expand=True)
-    for key, value in config.items():
+    for key, value in items:
         table.add_row(f"[bold]{key}[/bold]", str(value))
     title = "Hex Layout*" if unsaved else "Hex Layout"
     return Panel(table, title=title, border_style="cyan")
@@ -62,17 +86,22 @@ class DashboardView(Widget):
         self.title = title
         self._focus_detail: str | None = None
         self.notification_channel = notification_channel or NotificationChannel()
-        self._stats: dict[str, str] = {str(key): str(value) for key, value in (stats or {}).items()}
+        self._stats: dict[str, str] = _stringify(stats or {})
         self._layout_config: dict[str, str] | None = None
         # Track whether the layout has unsaved changes to toggle the star.
         self._layout_config_dirty: bool = False
         # Optional site context information displayed when a site is selected.
         self._site_context: list[str] = []
+        # (notifications panel, layout) from the last render.  The channel
+        # reuses its panel until its history changes, so the identity check
+        # covers notifications; the update methods below drop the cache.
+        self._layout_cache: tuple[RenderableType | None, Layout] | None = None
 
     def update_stats(self, stats: Mapping[str, str]) -> None:
-        self._stats = {str(key): str(value) for key, value in stats.items()}
+        self._stats = _stringify(stats)
         if self._focus_detail:
             self._stats["Focus"] = self._focus_detail
+        self._layout_cache = None
         self.refresh()
 
     def update_site_context(self, lines: list[str]) -> None:
@@ -87,6 +116,7 @@ class DashboardView(Widget):
         """
         # Store a shallow copy to avoid external mutation.
         self._site_context = list(lines) if lines else []
+        self._layout_cache = None
         self.refresh()
 
     def set_focus_detail(self, detail: str | None) -> None:
@@ -95,6 +125,7 @@ class DashboardView(Widget):
             self._stats["Focus"] = detail
         elif "Focus" in self._stats:
             del self._stats["Focus"]
+        self._layout_cache = None
         self.refresh()
 
     def update_layout_config(self, config: Mapping[str, str], *, unsaved: bool = False) -> None:
@@ -105,8 +136,9 @@ class DashboardView(Widget):
             unsaved: When ``True`` a star will be appended to the panel title
                 to indicate there are unsaved changes.
         """
-        self._layout_config = {str(key): str(value) for key, value in config.items()}
+        self._layout_config = _stringify(config)
         self._layout_config_dirty = bool(unsaved)
+        self._layout_cache = None
         self.refresh()
 
     def action_clear_notifications(self) -> None:
@@ -114,6 +146,12 @@ class DashboardView(Widget):
         self.refresh()
 
     def render(self) -> RenderableType:
+        channel = self.notification_channel
+        # An empty channel gets no section at all rather than an empty panel.
+        notifications = None if channel.is_empty else channel.render_panel(title="Notifications")
+        cached = self._layout_cache
+        if cached is not None and cached[0] is notifications:
+            return cached[1]
         layout = Layout(name="status")
         stats_mapping: Mapping[str, str] = self._stats
         stats_panel = (
@@ -121,7 +159,6 @@ class DashboardView(Widget):
             if stats_mapping
             else _placeholder_panel("Campaign Stats", "No statistics available")
         )
-        notifications = self.notification_channel.render_panel(title="Notifications")
         layout_sections = [Layout(stats_panel, name="stats", ratio=2)]
         if self._layout_config:
             layout_sections.append(
@@ -131,13 +168,13 @@ class DashboardView(Widget):
                     ratio=1,
                 )
             )
-        layout_sections.append(Layout(notifications, name="notifications", ratio=1))
+        if notifications is not None:
+            layout_sections.append(Layout(notifications, name="notifications", ratio=1))
         # Insert a site context panel if any context lines are provided.
         if self._site_context:
-            from rich.text import Text
-            context_body = Text()
-            for line in self._site_context:
-                context_body.append(line + "\n")
+            # One Text built from the joined lines; the trailing newline
+            # matches the previous line-by-line layout.
+            context_body = Text("\n".join(self._site_context) + "\n")
             layout_sections.append(
                 Layout(
                     Panel(context_body, title="Site Context", border_style="magenta"),
@@ -146,6 +183,7 @@ class DashboardView(Widget):
                 )
             )
         layout.split_column(*layout_sections)
+        self._layout_cache = (notifications, layout)
         return layout
 
 
@@ -9,25 +9,53 @@ values are friendly, negative values are hostile, and zero is neutral.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 import networkx as nx
-from rich.console import Group, RenderableType
+from rich.console import RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from textual.widget import Widget
 
 from ..factions import FactionRecord
 from ..world.graph import allied_factions
 
 
+def _header(*labels: str) -> tuple[Text, ...]:
+    return tuple(Text.from_markup(f"[bold]{label}[/bold]") for label in labels)
+
+
+# Header rows are styled once here instead of re-parsing markup per render.
+_STANDINGS_HEADER = _header("Faction A", "Faction B", "Standing")
+_ALLIANCES_HEADER = _header("Faction", "Allies")
+_REPUTATION_HEADER = _header("Faction", "Reputation", "Ideology")
+_NEGOTIATIONS_HEADER = _header("Faction", "Type", "Net", "Expires")
+_SECTION_TITLES = tuple(
+    Text(label, style="bold underline")
+    for label in ("Standings", "Alliances", "Reputation", "Negotiations")
+)
+
+
+@lru_cache(maxsize=8)
+def _status_panel(message: str, title: str, border_style: str) -> Panel:
+    """Return the shared placeholder panel shown before diplomacy data arrives."""
+
+    return Panel(message, title=title, border_style=border_style)
+
+
 @dataclass
 class DiplomacySnapshot:
     """Lightweight container describing current diplomacy state."""
 
     factions: Mapping[str, FactionRecord]
     graph: nx.Graph | None
+    # Sorted ``(faction_a, faction_b, standing)`` rows for the standings table.
+    edges: tuple[tuple[str, str, float], ...] = ()
+    # ``(faction, allies)`` rows for factions with at least one ally.
+    alliances: tuple[tuple[str, tuple[str, ...]], ...] = ()
 
 
 class DiplomacyView(Widget):
@@ -71,6 +99,8 @@ class DiplomacyView(Widget):
         graph: nx.Graph | None,
         negotiations: Sequence[Mapping[str, object]] | None = None,
         event_flags: Mapping[str, object] | None = None,
+        *,
+        copy: bool = False,
     ) -> None:
         """Store the latest diplomacy state and refresh the widget.
 
@@ -85,12 +115,38 @@ class DiplomacyView(Widget):
             provided, these will be displayed in a separate panel. Each entry
             should be a mapping with at least the keys ``faction``, ``type``,
             ``expires``, and either ``demand`` or ``reward``.
+        copy:
+            Take a private copy of ``factions``.  By default the mapping is
+            kept by reference; callers that change it should call this method
+            again so the widget refreshes.
         """
 
-        self._snapshot = DiplomacySnapshot(factions=dict(factions), graph=graph)
+        edges: tuple[tuple[str, str, float], ...] = ()
+        alliances: tuple[tuple[str, tuple[str, ...]], ...] = ()
+        if graph is not None:
+            # Sorted once per snapshot; render() runs on every widget refresh.
+            neutral = float(graph.graph.get("neutral_value", 0.0))
+            edges = tuple(
+                sorted(
+                    (faction_a, faction_b, float(data.get("weight", neutral)))
+                    for faction_a, faction_b, data in graph.edges(data=True)
+                )
+            )
+            threshold = self.alliance_threshold
+            alliances = tuple(
+                (faction, tuple(sorted(allies)))
+                for faction in sorted(graph.nodes)
+                if (allies := allied_factions(graph, faction, threshold=threshold))
+            )
+        self._snapshot = DiplomacySnapshot(
+            factions=dict(factions) if copy else factions,
+            graph=graph,
+            edges=edges,
+            alliances=alliances,
+        )
         if negotiations is not None:
-            # Normalize to a list of dicts for later rendering.
-            self._negotiations = [dict(item) for item in negotiations]
+            # Keep our own list; the proposal mappings are only read.
+            self._negotiations = list(negotiations)
         else:
             # Clear existing negotiations if none are supplied.
             self._negotiations = []
@@ -109,33 +165,15 @@ class DiplomacyView(Widget):
         graph = self._snapshot.graph
 
         if not factions:
-            return Panel(
-                "No faction data available",
-                title=self.title,
-                border_style=self.border_style,
-            )
+            return _status_panel("No faction data available", self.title, self.border_style)
 
         if graph is None or graph.number_of_nodes() == 0:
-            return Panel(
-                "Diplomacy records pending",
-                title=self.title,
-                border_style=self.border_style,
-            )
+            return _status_panel("Diplomacy records pending", self.title, self.border_style)
 
         standings_table = Table.grid(padding=(0, 1), expand=True)
-        standings_table.add_row(
-            "[bold]Faction A[/bold]", "[bold]Faction B[/bold]", "[bold]Standing[/bold]"
-        )
-
-        edges = sorted(
-            (
-                faction_a,
-                faction_b,
-                float(data.get("weight", graph.graph.get("neutral_value", 0.0))),
-            )
-            for faction_a, faction_b, data in graph.edges(data=True)
-        )
+        standings_table.add_row(*_STANDINGS_HEADER)
 
+        edges = self._snapshot.edges
         if edges:
             for faction_a, faction_b, value in edges:
                 standings_table.add_row(faction_a, faction_b, f"{value:+.1f}")
@@ -144,26 +182,18 @@ class DiplomacyView(Widget):
             standings_table.add_row("(no records)", "", f"{neutral:+.1f}")
 
         alliances_table = Table.grid(padding=(0, 1), expand=True)
-        alliances_table.add_row("[bold]Faction[/bold]", "[bold]Allies[/bold]")
-
-        alliance_rows = 0
-        for faction in sorted(graph.nodes):
-            allies = sorted(allied_factions(graph, faction, threshold=self.alliance_threshold))
-            if not allies:
-                continue
-            alliance_rows += 1
+        alliances_table.add_row(*_ALLIANCES_HEADER)
+
+        alliances = self._snapshot.alliances
+        for faction, allies in alliances:
             alliances_table.add_row(faction, ", ".join(allies))
 
-        if alliance_rows == 0:
+        if not alliances:
             alliances_table.add_row("(none)", "")
 
         # Build a table for player reputation
         rep_table = Table.grid(padding=(0, 1), expand=True)
-        rep_table.add_row(
-            "[bold]Faction[/bold]",
-            "[bold]Reputation[/bold]",
-            "[bold]Ideology[/bold]",
-        )
+        rep_table.add_row(*_REPUTATION_HEADER)
         for name, record in sorted(factions.items()):
             rep = getattr(record, "reputation", 0.0)
             ideology = getattr(record, "ideology", "neutral")
@@ -179,12 +209,7 @@ class DiplomacyView(Widget):
         # and the day on which it expires. If no negotiations are pending the
         # table will show a placeholder row.
         neg_table = Table.grid(padding=(0, 1), expand=True)
-        neg_table.add_row(
-            "[bold]Faction[/bold]",
-            "[bold]Type[/bold]",
-            "[bold]Net[/bold]",
-            "[bold]Expires[/bold]",
-        )
+        neg_table.add_row(*_NEGOTIATIONS_HEADER)
         if self._negotiations:
             for n in self._negotiations:
                 fac = str(n.get("faction", ""))
@@ -198,12 +223,15 @@ class DiplomacyView(Widget):
         else:
             neg_table.add_row("(none)", "", "", "")
 
-        body = Group(
-            Panel(standings_table, title="Standings", border_style=self.border_style),
-            Panel(alliances_table, title="Alliances", border_style=self.border_style),
-            Panel(rep_table, title="Reputation", border_style=self.border_style),
-            Panel(neg_table, title="Negotiations", border_style=self.border_style),
-        )
+        # One grid inside a single panel; nested panels made Rich measure
+        # every section twice.
+        body = Table.grid(expand=True)
+        sections = (standings_table, alliances_table, rep_table, neg_table)
+        for index, (section_title, table) in enumerate(zip(_SECTION_TITLES, sections, strict=True)):
+            if index:
+                body.add_row("")
+            body.add_row(section_title)
+            body.add_row(table)
 
         return Panel(body, title=self.title, border_style=self.border_style)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rich.table import Table
 from textual.binding import Binding
@@ -12,7 +13,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Static
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HelpCommand:
     """Description of a single command binding."""
 
@@ -20,13 +21,44 @@ class HelpCommand:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HelpSection:
     """Collection of related help commands."""
 
     title: str
     commands: Sequence[HelpCommand]
 
+    def __post_init__(self) -> None:
+        # Held as a tuple so sections are hashable and their tables cacheable.
+        object.__setattr__(self, "commands", tuple(self.commands))
+
+
+@lru_cache(maxsize=16)
+def _build_help_table(section: HelpSection) -> Table:
+    """Return the key/description grid for ``section``, built once per section."""
+
+    table = Table.grid(padding=(0, 2), expand=True)
+    table.add_column("Key", justify="right", style="bold")
+    table.add_column("Description", justify="left")
+    for command in section.commands:
+        table.add_row(command.key, command.description)
+    return table
+
+
+@lru_cache(maxsize=4)
+def _help_rows(sections: tuple[HelpSection, ...]) -> tuple[tuple[str, str, Table], ...]:
+    """Return ``(title, title_classes, table)`` for each section.
+
+    Textual widgets cannot be mounted twice, so ``compose`` still wraps these
+    in fresh ``Static`` instances each time the dialog opens.
+    """
+
+    first = "help-section-title help-section-title--first"
+    return tuple(
+        (section.title, first if index == 0 else "help-section-title", _build_help_table(section))
+        for index, section in enumerate(sections)
+    )
+
 
 class HelpScreen(ModalScreen[None]):
     """Modal dialog listing all available key bindings."""
@@ -89,22 +121,15 @@ class HelpScreen(ModalScreen[None]):
     ) -> None:
         super().__init__()
         self.sections: list[HelpSection] = list(sections)
+        self._rows = _help_rows(tuple(self.sections))
         self._on_close = on_close
 
     def compose(self):  # type: ignore[override]
         with Container(id="help-dialog"):
             yield Static("Help", id="help-title")
             with VerticalScroll(id="help-commands"):
-                for index, section in enumerate(self.sections):
-                    classes = "help-section-title"
-                    if index == 0:
-                        classes += " help-section-title--first"
-                    yield Static(section.title, classes=classes)
-                    table = Table.grid(padding=(0, 2), expand=True)
-                    table.add_column("Key", justify="right", style="bold")
-                    table.add_column("Description", justify="left")
-                    for command in section.commands:
-                        table.add_row(command.key, command.description)
+                for title, classes, table in self._rows:
+                    yield Static(title, classes=classes)
                     yield Static(table, classes="help-table")
             yield Button("Close", id="help-close")
 
@@ -126,13 +151,11 @@ class HelpScreen(ModalScreen[None]):
         self._notify_close()
 
 
-def build_help_commands(bindings: Iterable[Binding]) -> list[HelpCommand]:
+def build_help_commands(bindings: Iterable[Binding]) -> tuple[HelpCommand, ...]:
     """Convert Textual bindings into help command entries."""
 
-    commands: list[HelpCommand] = []
-    for binding in bindings:
-        description = binding.description or ""
-        key = binding.key_display or binding.key
-        commands.append(HelpCommand(key=key, description=description))
-    return commands
+    return tuple(
+        HelpCommand(key=binding.key_display or binding.key, description=binding.description or "")
+        for binding in bindings
+    )
 
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Tuple
-
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 try:  # pragma: no cover - prefer Rich's Canvas when available
     from rich.canvas import Canvas as RichCanvas
@@ -50,6 +49,19 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for newer Rich releas
             if 0 <= x < self.width and 0 <= y < self.height:
                 self._grid[y][x] = _Cell(char, style)
 
+        def fill_span(
+            self, y: int, x_start: int, x_end: int, char: str, *, style: Style | str | None = None
+        ) -> None:
+            """Set cells ``x_start..x_end`` (inclusive) of row ``y`` in one slice."""
+
+            if not 0 <= y < self.height:
+                return
+            x_start = max(0, x_start)
+            x_end = min(self.width - 1, x_end)
+            if x_start <= x_end:
+                # Cells are replaced, never mutated, so one instance can fill the run.
+                self._grid[y][x_start : x_end + 1] = [_Cell(char, style)] * (x_end - x_start + 1)
+
         def text(self, x: int, y: int, value: str, *, style: Style | str | None = None) -> None:
             for offset, char in enumerate(value):
                 self.set(x + offset, y, char, style=style)
@@ -110,6 +122,8 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for newer Rich releas
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing aid for mypy
+    import numpy as np
+    from numpy.typing import NDArray
     from rich.canvas import Canvas as RichCanvas
 from textual import events
 from textual.binding import Binding
@@ -141,6 +155,21 @@ def hex_polygon(layout: Layout, cx: float, cy: float) -> Poly:
     return points
 
 
+def hex_vertex_offsets(layout: Layout) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return the x and y offsets of the six vertices from a hex centre.
+
+    Matches :func:`hex_polygon` so ``cx + dx`` and ``cy - dy`` give the same
+    vertices.
+    """
+
+    orientation = layout.orientation
+    angles = [math.tau * (orientation.start_angle + index) / 6.0 for index in range(6)]
+    return (
+        tuple(layout.size_x * math.cos(angle) for angle in angles),
+        tuple(layout.size_y * math.sin(angle) for angle in angles),
+    )
+
+
 def point_in_convex_poly(x: float, y: float, poly: Poly) -> bool:
     """Return True if the point (x, y) lies within the convex polygon."""
 
@@ -159,6 +188,44 @@ def point_in_convex_poly(x: float, y: float, poly: Poly) -> bool:
     return True
 
 
+def convex_poly_spans(
+    poly: Poly, min_x: int, max_x: int, min_y: int, max_y: int
+) -> Iterator[tuple[int, int, int]]:
+    """Yield ``(y, x_start, x_end)`` runs of cells whose centres lie in ``poly``.
+
+    Each row is sampled at ``y + 0.5`` and intersected with the polygon edges,
+    matching :func:`point_in_convex_poly` at every cell centre without testing
+    cells one by one.  Runs are inclusive and clipped to the given bounds.
+    """
+
+    # (top y, bottom y, x at top, dx/dy); horizontal edges are covered by
+    # their neighbours' end points.
+    edges: list[tuple[float, float, float, float]] = []
+    total = len(poly)
+    for index in range(total):
+        x1, y1 = poly[index]
+        x2, y2 = poly[(index + 1) % total]
+        if y1 == y2:
+            continue
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        edges.append((y1, y2, x1, (x2 - x1) / (y2 - y1)))
+
+    for y in range(min_y, max_y + 1):
+        sample = y + 0.5
+        crossings = [
+            x_top + (sample - top) * slope
+            for top, bottom, x_top, slope in edges
+            if top <= sample <= bottom
+        ]
+        if not crossings:
+            continue
+        start = max(min_x, math.ceil(min(crossings) - 0.5))
+        end = min(max_x, math.floor(max(crossings) - 0.5))
+        if start <= end:
+            yield y, start, end
+
+
 class HexCanvas(Widget):
     """Hex grid drawn on a Rich canvas with hover and click support."""
 
@@ -221,6 +288,11 @@ class HexCanvas(Widget):
         # executes.
         self._config_preexisted: bool = CONFIG_PATH.exists()
         self._centres: Dict[Tuple[int, int], Point] = {}
+        # Centres as parallel arrays in ``_centres`` order for the renderer;
+        # ``None`` until the first rebuild.
+        self._centre_keys: list[tuple[int, int]] = []
+        self._cx: NDArray[np.float64] | None = None
+        self._cy: NDArray[np.float64] | None = None
         self._hex_layout: Layout | None = None
         self.cfg: HexLayoutConfig | None = None
         self._initial_hex_height = float(radius) * 2.0
@@ -260,29 +332,41 @@ class HexCanvas(Widget):
 
     # ------------------------------------------------------------------
     def _rebuild_centres(self) -> None:
-        if self._hex_layout is None:
-            self._rebuild_layout()
-        self._centres.clear()
-        for q in range(self.cols):
-            for r in range(self.rows):
-                self._centres[(q, r)] = self._centre_for(q, r)
+        # NumPy is imported on first use so importing the widget stays cheap.
+        import numpy as np
 
-    def _centre_for(self, q: int, r: int) -> tuple[float, float]:
         config = self._ensure_config()
         if self._hex_layout is None:
             self._rebuild_layout()
-
         layout = self._hex_layout
+        assert layout is not None
+
+        cols, rows = int(self.cols), int(self.rows)
+        q = np.repeat(np.arange(cols), rows)
+        r = np.tile(np.arange(rows), cols)
         offset_mode = config.offset_mode
+        qf = q.astype(np.float64)
+        rf = r.astype(np.float64)
         if config.orientation == "pointy":
-            parity = (r & 1) if offset_mode in ("odd-r", "even-r") else 0
-            if offset_mode == "even-r":
+            if offset_mode in ("odd-r", "even-r"):
+                parity = r & 1
+                if offset_mode == "even-r":
+                    parity ^= 1
+                qf += 0.5 * parity
+        elif offset_mode in ("odd-q", "even-q"):
+            parity = q & 1
+            if offset_mode == "even-q":
                 parity ^= 1
-            return layout.hex_to_pixel(q + 0.5 * parity, r)
-        parity = (q & 1) if offset_mode in ("odd-q", "even-q") else 0
-        if offset_mode == "even-q":
-            parity ^= 1
-        return layout.hex_to_pixel(q, r + 0.5 * parity)
+            rf += 0.5 * parity
+
+        # Same arithmetic as ``Layout.hex_to_pixel``, applied to the whole grid.
+        m = layout.orientation
+        centre_x = (m.f0 * qf + m.f1 * rf) * layout.size_x + layout.origin_x
+        centre_y = (m.f2 * qf + m.f3 * rf) * layout.size_y + layout.origin_y
+        self._cx, self._cy = centre_x, centre_y
+        self._centre_keys = list(zip(q.tolist(), r.tolist(), strict=True))
+        centres = zip(centre_x.tolist(), centre_y.tolist(), strict=True)
+        self._centres = dict(zip(self._centre_keys, centres, strict=True))
 
     def _rebuild_layout(self) -> None:
         if self.cfg is None:
@@ -318,17 +402,50 @@ class HexCanvas(Widget):
             self._rebuild_layout()
         layout = self._hex_layout
         assert layout is not None
+        centre_x, centre_y = self._cx, self._cy
+        if centre_x is None or centre_y is None:
+            # No centres have been laid out yet, so there is nothing to draw.
+            return canvas
+
+        import numpy as np
+
+        base_fills = {
+            "Fo": self.fill_forest,
+            "Sc": self.fill_scrub,
+            "Ba": self.fill_barren,
+        }
+        hovered = self.hovered
+        # Only the stand-in canvas writes a run in one slice; Rich's own Canvas
+        # is filled cell by cell.
+        fill_span = getattr(canvas, "fill_span", None)
+
+        # Vertices and clipped bounding boxes for every hex in one broadcast.
+        dx, dy = hex_vertex_offsets(layout)
+        vertex_x = centre_x[:, None] + np.array(dx)
+        vertex_y = centre_y[:, None] - np.array(dy)
+        bounds = zip(
+            np.maximum(0, np.floor(vertex_x.min(axis=1))).astype(int).tolist(),
+            np.minimum(width - 1, np.ceil(vertex_x.max(axis=1))).astype(int).tolist(),
+            np.maximum(0, np.floor(vertex_y.min(axis=1))).astype(int).tolist(),
+            np.minimum(height - 1, np.ceil(vertex_y.max(axis=1))).astype(int).tolist(),
+            strict=True,
+        )
+        hexes = zip(
+            self._centre_keys,
+            centre_x.tolist(),
+            centre_y.tolist(),
+            vertex_x.tolist(),
+            vertex_y.tolist(),
+            bounds,
+            strict=True,
+        )
 
-        for (q, r), (cx, cy) in self._centres.items():
+        for (q, r), cx, cy, xs, ys, (min_x, max_x, min_y, max_y) in hexes:
             tile_code = self.tiles.get((q, r), "Sc")
-            base_fill = {
-                "Fo": self.fill_forest,
-                "Sc": self.fill_scrub,
-                "Ba": self.fill_barren,
-            }.get(tile_code, self.fill_scrub)
+            base_fill = base_fills.get(tile_code, self.fill_scrub)
 
             highlight_label = self.highlights.get((q, r))
-            is_hovered = self.hovered == (q, r)
+            is_hovered = hovered == (q, r)
 
             fill_colour = (
                 self.fill_hover
@@ -339,16 +456,14 @@ class HexCanvas(Widget):
             )
             edge_colour = self.edge_hover if (is_hovered or highlight_label is not None) else self.edge
 
-            points = hex_polygon(layout, cx, cy)
+            points = list(zip(xs, ys, strict=True))
 
-            min_x = int(max(0, math.floor(min(point[0] for point in points))))
-            max_x = int(min(width - 1, math.ceil(max(point[0] for point in points))))
-            min_y = int(max(0, math.floor(min(point[1] for point in points))))
-            max_y = int(min(height - 1, math.ceil(max(point[1] for point in points))))
             background_style = f"on {fill_colour}"
-            for y in range(min_y, max_y + 1):
-                for x in range(min_x, max_x + 1):
-                    if point_in_convex_poly(x + 0.5, y + 0.5, points):
+            for y, start, end in convex_poly_spans(points, min_x, max_x, min_y, max_y):
+                if fill_span is not None:
+                    fill_span(y, start, end, " ", style=background_style)
+                else:
+                    for x in range(start, end + 1):
                         canvas.set(x, y, " ", style=background_style)
 
             for index in range(6):
@@ -508,10 +623,12 @@ class HexCanvas(Widget):
         raised during the save attempt a ``LayoutConfigSaveFailed`` message
         will be posted carrying the original error.  Regardless of outcome the
         layout change will be emitted so the UI can update its indicators.
+        Repeated saves without intervening changes do not touch the disk.
         """
         cfg = self._ensure_config()
         try:
-            cfg.save()
+            if cfg.dirty:
+                cfg.save()
             # Saving will clear the dirty flag.  Emit a saved message so the
             # dashboard knows to clear the unsaved indicator.
             self._emit_config_changed(saved=True)
@@ -22,11 +22,14 @@ bias mapping is supplied, the default distribution defined in
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
+from numpy.typing import NDArray
 from opensimplex import OpenSimplex
 
 from ..rng import WorldRandomness
@@ -131,6 +134,17 @@ class MapChunk:
 class BiomeNoise:
     """Deterministic noise generator for biome classification."""
 
+    # Biomes in ascending noise order, split at ``_BAND_THRESHOLDS``; both
+    # :meth:`biome` and :meth:`biome_ids` classify through this one table.
+    BIOME_BANDS: ClassVar[tuple[BiomeType, ...]] = (
+        BiomeType.WATER,
+        BiomeType.BARREN,
+        BiomeType.SCRUBLAND,
+        BiomeType.FOREST,
+        BiomeType.HIGHLAND,
+    )
+    _BAND_THRESHOLDS: ClassVar[tuple[float, ...]] = (0.1, 0.35, 0.6, 0.85)
+
     def __init__(
         self,
         *,
@@ -152,16 +166,20 @@ class BiomeNoise:
         return float(0.5 + 0.5 * sample)
 
     def biome(self, coord: HexCoord) -> BiomeType:
-        sample = self.value(coord)
-        if sample < 0.1:
-            return BiomeType.WATER
-        if sample < 0.35:
-            return BiomeType.BARREN
-        if sample < 0.6:
-            return BiomeType.SCRUBLAND
-        if sample < 0.85:
-            return BiomeType.FOREST
-        return BiomeType.HIGHLAND
+        return self.BIOME_BANDS[bisect_right(self._BAND_THRESHOLDS, self.value(coord))]
+
+    def biome_ids(self, q_values: Sequence[int], r_values: Sequence[int]) -> NDArray[np.int8]:
+        """Classify a rectangular block of coordinates in one vectorised pass.
+
+        The result has one row per ``r`` and one column per ``q``; each entry
+        indexes :attr:`BIOME_BANDS` and matches :meth:`biome` for that cell.
+        """
+
+        xs = np.asarray(q_values, dtype=np.float64) * self._frequency
+        ys = np.asarray(r_values, dtype=np.float64) * self._frequency
+        samples: NDArray[np.float64] = 0.5 + 0.5 * self._noise.noise2array(xs, ys)
+        bands = np.searchsorted(self._BAND_THRESHOLDS, samples, side="right")
+        return bands.astype(np.int8)
 
 
 class ChunkGenerator:
@@ -86,6 +86,93 @@ def _json_safe(obj: Any) -> Any:
     return str(obj)
 
 
+def build_save_payload(
+    world_state: Mapping[str, Any], faction_controller: Any
+) -> Dict[str, Any]:
+    """Assemble the JSON‑safe quick-save payload without touching disk.
+
+    Faction data is collected from the provided ``faction_controller`` via
+    its ledger, including ideology weights, behavioural traits and
+    reputation for each faction.  The ``world_state`` is filtered through
+    ``_json_safe``.  The returned structure shares no mutable state with
+    its inputs, so it can be written from another thread.
+
+    Args:
+        world_state: The global state dictionary shared across game
+            systems.
+        faction_controller: The FactionAIController instance whose
+            ledger stores faction information.  It must expose
+            ``factions`` (mapping) and ``ledger`` (FactionLedger).
+
+    Returns:
+        A dictionary with ``world_state`` and ``factions`` entries.
+    """
+    factions_data: Dict[str, Dict[str, Any]] = {}
+    if hasattr(faction_controller, "factions") and hasattr(faction_controller, "ledger"):
+        ledger = getattr(faction_controller, "ledger")
+        factions_map = getattr(faction_controller, "factions")
+        try:
+            trait_names = list(getattr(ledger, "DEFAULT_TRAITS", []))
+        except Exception:
+            trait_names = []
+        for name, rec in factions_map.items():
+            # Ideology weights
+            try:
+                ide_weights = _json_safe(ledger.ideology_weights(name))
+            except Exception:
+                ide_weights = {}
+            # Traits
+            traits: Dict[str, float] = {}
+            for t_name in trait_names:
+                try:
+                    traits[t_name] = float(ledger.get_trait(name, t_name, 0.0))
+                except Exception:
+                    traits[t_name] = 0.0
+            # Reputation (may be stored on FactionRecord)
+            try:
+                rep = float(getattr(rec, "reputation", 0.0))
+            except Exception:
+                rep = 0.0
+            factions_data[name] = {
+                "ideology_weights": ide_weights,
+                "traits": traits,
+                "reputation": rep,
+            }
+    # Filter world_state to JSON‑safe content
+    safe_state = {}
+    for key, val in world_state.items():
+        # Skip objects known to be non‑serialisable (e.g. randomness
+        # generators).  We persist only those keys relevant to
+        # simulation continuity.
+        if key in {"randomness", "rng", "_rng"}:
+            continue
+        safe_state[key] = _json_safe(val)
+    return {
+        "world_state": safe_state,
+        "factions": factions_data,
+    }
+
+
+def write_save_payload(
+    payload: Mapping[str, Any],
+    *,
+    slot: str = "default",
+    app_name: str = "survival_truck",
+) -> None:
+    """Write a payload from :func:`build_save_payload` to ``<slot>_save.json``.
+
+    Args:
+        payload: The structure returned by :func:`build_save_payload`.
+        slot: An identifier for the save slot (default "default").
+        app_name: The application name used to compute the save
+            directory.  Defaults to "survival_truck".
+    """
+    save_dir = _get_save_dir(app_name)
+    filepath = os.path.join(save_dir, f"{slot}_save.json")
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
 def save_game_state(
     world_state: Mapping[str, Any],
     faction_controller: Any,
@@ -95,73 +182,21 @@ def save_game_state(
 ) -> None:
     """Persist the current game state to a JSON file.
 
-    The ``world_state`` is filtered through ``_json_safe`` to ensure
-    that all values are JSON‑serialisable.  Faction data is collected
-    from the provided ``faction_controller`` via its ledger, including
-    ideology weights, behavioural traits and reputation for each
-    faction.  The resulting structure is written to a file named
-    ``<slot>_save.json`` in the user data directory.
+    This is :func:`build_save_payload` followed by
+    :func:`write_save_payload`; see those helpers for the payload layout.
 
     Args:
         world_state: The global state dictionary shared across game
             systems.
         faction_controller: The FactionAIController instance whose
-            ledger stores faction information.  It must expose
-            ``factions`` (mapping) and ``ledger`` (FactionLedger).
+            ledger stores faction information.
         slot: An identifier for the save slot (default "default").
         app_name: The application name used to compute the save
             directory.  Defaults to "survival_truck".
     """
     try:
-        save_dir = _get_save_dir(app_name)
-        filepath = os.path.join(save_dir, f"{slot}_save.json")
-        # Assemble faction data
-        factions_data: Dict[str, Dict[str, Any]] = {}
-        if hasattr(faction_controller, "factions") and hasattr(faction_controller, "ledger"):
-            ledger = getattr(faction_controller, "ledger")
-            factions_map = getattr(faction_controller, "factions")
-            try:
-                trait_names = list(getattr(ledger, "DEFAULT_TRAITS", []))
-            except Exception:
-                trait_names = []
-            for name, rec in factions_map.items():
-                # Ideology weights
-                try:
-                    ide_weights = ledger.ideology_weights(name)
-                except Exception:
-                    ide_weights = {}
-                # Traits
-                traits: Dict[str, float] = {}
-                for t_name in trait_names:
-                    try:
-                        traits[t_name] = float(ledger.get_trait(name, t_name, 0.0))
-                    except Exception:
-                        traits[t_name] = 0.0
-                # Reputation (may be stored on FactionRecord)
-                try:
-                    rep = float(getattr(rec, "reputation", 0.0))
-                except Exception:
-                    rep = 0.0
-                factions_data[name] = {
-                    "ideology_weights": ide_weights,
-                    "traits": traits,
-                    "reputation": rep,
-                }
-        # Filter world_state to JSON‑safe content
-        safe_state = {}
-        for key, val in world_state.items():
-            # Skip objects known to be non‑serialisable (e.g. randomness
-            # generators).  We persist only those keys relevant to
-            # simulation continuity.
-            if key in {"randomness", "rng", "_rng"}:
-                continue
-            safe_state[key] = _json_safe(val)
-        data = {
-            "world_state": safe_state,
-            "factions": factions_data,
-        }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        payload = build_save_payload(world_state, faction_controller)
+        write_save_payload(payload, slot=slot, app_name=app_name)
     except Exception:
         # Fail silently: persistence is best effort.  Errors can be
         # surfaced via the caller's notification channel if desired.
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from game.ui import config_store
+from game.ui import hex_canvas as ui_hex_canvas
+
+
+@pytest.fixture
+def layout_config_path(tmp_path, monkeypatch) -> Path:
+    """Point the hex layout config at a per-test file that does not exist yet."""
+
+    config_path = tmp_path / "hex_layout.json"
+    monkeypatch.setattr(config_store, "CONFIG_PATH", config_path, raising=False)
+    monkeypatch.setattr(ui_hex_canvas, "CONFIG_PATH", config_path, raising=False)
+    return config_path
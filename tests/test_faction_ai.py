@@ -1,4 +1,5 @@
 from game.factions import FactionAIController, FactionDiplomacy
+from game.factions.state import FactionLedger
 from game.world.rng import WorldRandomness
 from game.world.sites import Site
 
@@ -105,3 +106,32 @@ def test_faction_ai_fsm_manual_transitions_progress_states() -> None:
 
     ai.refresh_alliance()
     assert ai.state == "patrol"
+
+
+def test_ledger_revision_tracks_new_factions_only() -> None:
+    ledger = FactionLedger()
+    start = ledger.revision
+    ledger.ensure_faction("Rustblades")
+    assert ledger.revision == start + 1
+    ledger.ensure_faction("Rustblades")
+    ledger.adjust_reputation("Rustblades", 5.0)
+    assert ledger.revision == start + 1
+    assert ledger.clone().revision == ledger.revision
+
+
+def test_adjust_standing_many_matches_pairwise_adjustments() -> None:
+    batched = FactionDiplomacy()
+    pairwise = FactionDiplomacy()
+    names = ("Rustblades", "Dune Riders", "Northern Guild")
+    batched.set_standing("Rustblades", "Dune Riders", -99.98)
+    pairwise.set_standing("Rustblades", "Dune Riders", -99.98)
+
+    batched.adjust_standing_many("Rustblades", names, -0.05)
+    for other in names:
+        pairwise.adjust_standing("Rustblades", other, -0.05)
+
+    for other in names:
+        assert batched.get_standing("Rustblades", other) == pairwise.get_standing(
+            "Rustblades", other
+        )
+    assert batched.get_standing("Rustblades", "Dune Riders") == -100.0
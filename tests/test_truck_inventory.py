@@ -28,3 +28,28 @@ def test_add_item_raises_when_volume_capacity_exceeded():
 
     with pytest.raises(InventoryCapacityError, match="volume"):
         inventory.add_item(oversized_item)
+
+
+def test_revision_tracks_cargo_changes():
+    inventory = Inventory()
+    water = InventoryItem(
+        item_id="water",
+        name="Water",
+        category=ItemCategory.WATER,
+        quantity=4,
+        weight_per_unit=1,
+        volume_per_unit=1,
+    )
+    start = inventory.revision
+
+    inventory.add_item(water)
+    after_add = inventory.revision
+    assert after_add > start
+
+    inventory.remove_item("water", 1)
+    assert inventory.revision > after_add
+
+    unchanged = inventory.revision
+    assert inventory.total_weight == pytest.approx(3.0)
+    inventory.advance_time(1.0)
+    assert inventory.revision == unchanged
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import asdict
+
+import pytest
+
+from game.truck.models import Dimensions, ModuleCapacityError, Truck, TruckModule
+
+
+def test_fits_within_matches_per_axis_comparison() -> None:
+    values = (0, 1, 2, 3, 7)
+    for inner, outer in itertools.product(itertools.product(values, repeat=3), repeat=2):
+        small = Dimensions(*inner)
+        large = Dimensions(*outer)
+        expected = all(a <= b for a, b in zip(inner, outer, strict=True))
+        assert small.fits_within(large) is expected, (inner, outer)
+
+
+@pytest.mark.parametrize(
+    ("inner", "outer", "expected"),
+    [
+        ((-1, 2, 2), (4, 2, 2), True),
+        ((2, 2, 2), (4, -2, 2), False),
+        ((2**21, 1, 1), (2**21, 1, 1), True),
+        ((2**21 + 1, 1, 1), (2**21, 1, 1), False),
+    ],
+)
+def test_fits_within_handles_values_outside_packed_range(
+    inner: tuple[int, int, int], outer: tuple[int, int, int], expected: bool
+) -> None:
+    assert Dimensions(*inner).fits_within(Dimensions(*outer)) is expected
+
+
+def test_cached_values_stay_out_of_equality_and_serialisation() -> None:
+    dims = Dimensions(length=4, width=2, height=3)
+
+    assert dims.volume == 24
+    assert dims.fits_within(Dimensions(4, 2, 3))
+    assert dims == Dimensions(4, 2, 3)
+    assert hash(dims) == hash(Dimensions(4, 2, 3))
+    assert asdict(dims) == {"length": 4, "width": 2, "height": 3}
+
+
+def _module(module_id: str, length: int, width: int, height: int) -> TruckModule:
+    return TruckModule(
+        module_id=module_id,
+        name=module_id.title(),
+        size=Dimensions(length, width, height),
+    )
+
+
+def test_unequip_frees_module_volume() -> None:
+    truck = Truck(
+        name="Hauler",
+        module_capacity=Dimensions(4, 2, 2),
+        crew_capacity=0,
+        base_power_output=0,
+    )
+    truck.equip_module(_module("cabin", 2, 2, 2))
+    truck.equip_module(_module("workshop", 2, 2, 2))
+
+    with pytest.raises(ModuleCapacityError, match="volume"):
+        truck.equip_module(_module("tank", 1, 1, 1))
+
+    truck.unequip_module("workshop")
+    truck.equip_module(_module("tank", 1, 1, 1))
+
+    assert set(truck.modules) == {"cabin", "tank"}
+
+
+def test_preinstalled_modules_count_towards_volume() -> None:
+    truck = Truck(
+        name="Hauler",
+        module_capacity=Dimensions(2, 2, 2),
+        crew_capacity=0,
+        base_power_output=0,
+        modules={"cabin": _module("cabin", 2, 2, 2)},
+    )
+
+    with pytest.raises(ModuleCapacityError, match="volume"):
+        truck.equip_module(_module("tank", 1, 1, 1))
+
+
+def test_maintenance_reports_share_conditions_until_a_module_degrades() -> None:
+    truck = Truck(
+        name="Hauler",
+        module_capacity=Dimensions(4, 2, 2),
+        crew_capacity=0,
+        base_power_output=0,
+    )
+    module = _module("cabin", 2, 2, 2)
+    module.degradation_rate = 0.0
+    truck.equip_module(module)
+
+    first = truck.run_maintenance_cycle(0)
+    second = truck.run_maintenance_cycle(0)
+    assert second.module_conditions is first.module_conditions
+    assert dict(second.module_conditions) == {"cabin": 1.0}
+
+    module.degradation_rate = 0.1
+    third = truck.run_maintenance_cycle(0)
+    assert third.module_conditions is not first.module_conditions
+    assert third.module_conditions["cabin"] < 1.0
+    assert third.degraded_modules == ["base_vehicle", "cabin"]
+    assert asdict(third)["module_conditions"] == {"cabin": module.condition}
+
+
+def test_stats_match_individual_properties() -> None:
+    truck = Truck(
+        name="Hauler",
+        module_capacity=Dimensions(4, 2, 2),
+        crew_capacity=6,
+        base_power_output=12,
+        base_power_draw=4,
+        base_storage_capacity=150,
+        base_weight_capacity=4500.0,
+        base_maintenance_load=5,
+    )
+    truck.equip_module(
+        TruckModule(
+            module_id="workshop",
+            name="Workshop",
+            size=Dimensions(2, 2, 2),
+            power_output=3,
+            power_draw=5,
+            storage_bonus=15,
+            weight_bonus=250.0,
+            crew_required=2,
+            maintenance_load=2,
+        )
+    )
+
+    stats = truck.stats
+
+    assert stats.power_output == truck.power_output == 15
+    assert stats.power_draw == truck.power_draw == 9
+    assert stats.storage_capacity == truck.storage_capacity == 165
+    assert stats.weight_capacity == truck.weight_capacity == 4750.0
+    assert stats.crew_workload == truck.current_crew_workload == 2
+    assert stats.maintenance_load == truck.maintenance_load == 7
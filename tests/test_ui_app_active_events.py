@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from game.ui.app import SurvivalTruckApp
+
+
+@pytest.fixture
+def app(layout_config_path) -> SurvivalTruckApp:
+    return SurvivalTruckApp(config=SurvivalTruckApp._create_demo_config())
+
+
+def _advance(app: SurvivalTruckApp, day: int) -> list[object]:
+    app._update_active_events(SimpleNamespace(day=day))
+    return [record["expires"] for record in app.world_state["active_events"]]
+
+
+def test_active_events_expire_day_by_day_with_coercible_expiry(app) -> None:
+    app.world_state["active_events"] = [
+        {"type": "storm", "expires": 3},
+        {"type": "caravan", "expires": "5"},
+        {"type": "pandemic", "expires": 7.0},
+        {"type": "derelict", "expires": "soon"},
+        {"type": "bandits", "expires": 6},
+    ]
+
+    assert _advance(app, 2) == [3, "5", 7.0, 6]
+    assert _advance(app, 3) == ["5", 7.0, 6]
+    assert _advance(app, 4) == ["5", 7.0, 6]
+    assert _advance(app, 5) == [7.0, 6]
+    assert _advance(app, 6) == [7.0]
+    assert _advance(app, 7) == []
+    assert app._active_events_source is app.world_state["active_events"]
+
+
+def test_active_events_reindex_after_list_swap_or_append(app) -> None:
+    app.world_state["active_events"] = [{"type": "storm", "expires": 4}]
+    assert _advance(app, 1) == [4]
+    indexed = app.world_state["active_events"]
+    assert app._active_events_source is indexed
+
+    # Appended outside the generator: the length check re-indexes the list.
+    indexed.append({"type": "caravan", "expires": 2})
+    assert _advance(app, 2) == [4]
+
+    # Replaced wholesale, e.g. by a restored save.
+    app.world_state["active_events"] = [{"type": "bandits", "expires": "9"}]
+    assert _advance(app, 5) == ["9"]
+    assert app._active_events_source is app.world_state["active_events"]
+    assert len(app._active_event_heap) == 1
+    assert _advance(app, 9) == []
+
+
+def test_missions_and_negotiations_accept_coercible_expiry(app) -> None:
+    controller = app._faction_controller()
+    for name in ("Northern Guild", "Dune Riders"):
+        controller.ledger.ensure_faction(name)
+    context = SimpleNamespace(day=10, notifications=[])
+    missions = [
+        {"faction": "Dune Riders", "type": "aid_event", "expires": "20"},
+        {"faction": "Northern Guild", "type": "escort_event", "expires": 15.0},
+    ]
+    app.world_state["missions"] = list(missions)
+    app.world_state["negotiations"] = [
+        {"faction": "Northern Guild", "type": "aid", "demand": 0, "reward": 30, "expires": "15"},
+    ]
+
+    app._process_negotiations(context)
+    app._process_expired_missions(context)
+
+    assert app.world_state["missions"] == missions
+    assert controller.factions["Northern Guild"].reputation > 0
+    assert controller.factions["Dune Riders"].reputation == 0
@@ -0,0 +1,94 @@
+from game.events.event_queue import QueuedEvent
+from game.ui.channels import LogEntry, NotificationChannel, NotificationRecord, TurnLogChannel
+
+
+def test_channels_keep_only_the_newest_entries() -> None:
+    log = TurnLogChannel(max_entries=3)
+    for day in range(5):
+        log.push(LogEntry(day=day, summary=f"day {day}"))
+    assert [entry.day for entry in log.entries] == [2, 3, 4]
+
+    channel = NotificationChannel(max_entries=3)
+    channel.notify(0, "first")
+    channel.push_many(NotificationRecord(day=day, message=str(day)) for day in range(1, 5))
+    assert [record.day for record in channel.notifications] == [2, 3, 4]
+
+    channel.clear()
+    assert channel.notifications == ()
+
+
+def test_snapshots_are_reused_until_the_channel_changes() -> None:
+    channel = NotificationChannel()
+    channel.notify(1, "hello")
+    first = channel.notifications
+    assert channel.notifications is first
+
+    channel.notify(2, "again")
+    assert channel.notifications is not first
+    assert [record.message for record in channel.notifications] == ["hello", "again"]
+
+    log = TurnLogChannel()
+    log.push(LogEntry(day=1, summary="start"))
+    entries = log.entries
+    assert log.entries is entries
+    log.push(LogEntry(day=2, summary="next"))
+    assert len(log.entries) == 2
+
+
+def test_format_brief_is_cached_and_omits_empty_payload() -> None:
+    plain = NotificationRecord(day=3, message="All quiet")
+    assert plain.format_brief() == "[info] Day 3: All quiet"
+
+    record = NotificationRecord(day=4, message="Raid", category="event", payload={"site": "A"})
+    brief = record.format_brief()
+    assert brief == "[event] Day 4: Raid (site=A)"
+    assert record.format_brief() is brief
+    assert record == NotificationRecord(
+        day=4, message="Raid", category="event", payload={"site": "A"}
+    )
+    assert "_brief" not in repr(record)
+
+
+def test_extend_from_events_and_schedule_respect_the_bound() -> None:
+    channel = NotificationChannel(max_entries=3)
+    events = [
+        QueuedEvent(day=day, event_type="dust_storm", payload={"message": f"storm {day}"})
+        for day in range(4)
+    ]
+    channel.extend_from_events(9, events)
+    assert [record.message for record in channel.notifications] == ["storm 1", "storm 2", "storm 3"]
+    assert channel.notifications[-1].payload == {"event_type": "dust_storm", "scheduled_for": 3}
+
+    channel.extend_from_schedule([QueuedEvent(day=12, event_type="convoy", payload={})])
+    latest = channel.notifications[-1]
+    assert (latest.day, latest.category, latest.message) == (12, "schedule", "Scheduled convoy")
+    assert len(channel.notifications) == 3
+
+
+def test_rendered_panels_are_reused_until_the_channel_changes() -> None:
+    channel = NotificationChannel()
+    channel.notify(1, "hello")
+    panel = channel.render_panel()
+    assert channel.render_panel() is panel
+    assert channel.render_panel(title="Other") is not panel
+
+    channel.notify(2, "again")
+    assert channel.render_panel() is not panel
+
+    log = TurnLogChannel()
+    log.push(LogEntry(day=1, summary="start"))
+    table = log.render_table()
+    assert log.render_table() is table
+    log.push(LogEntry(day=2, summary="next"))
+    assert log.render_table() is not table
+
+
+def test_records_without_payload_share_one_empty_mapping() -> None:
+    channel = NotificationChannel()
+    first = channel.notify(1, "quiet")
+    second = channel.notify(2, "still quiet", payload={})
+    direct = NotificationRecord(day=3, message="direct", payload={})
+
+    assert first.payload is second.payload is direct.payload
+    assert first.payload == {}
+    assert channel.notify(4, "busy", payload={"site": "A"}).payload == {"site": "A"}
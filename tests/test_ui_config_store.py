@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from game.ui.config_store import HexLayoutConfig
+
+
+def test_save_writes_compact_json_that_load_round_trips(layout_config_path):
+    cfg = HexLayoutConfig(orientation="flat", flatten=0.8, origin_x=3.0, dirty=True)
+    cfg.save()
+
+    assert cfg.dirty is False
+    text = layout_config_path.read_text()
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text) == cfg.to_dict()
+
+    loaded = HexLayoutConfig.load()
+    assert loaded.to_dict() == cfg.to_dict()
+    assert loaded.dirty is False
+    assert loaded.flatten == pytest.approx(0.8)
+
+
+def test_load_fills_missing_fields_and_ignores_dirty(layout_config_path):
+    payload = {"orientation": "flat", "flatten": 5.0, "dirty": True}
+    layout_config_path.write_text(json.dumps(payload))
+
+    loaded = HexLayoutConfig.load()
+
+    assert loaded.orientation == "flat"
+    assert loaded.flatten == pytest.approx(1.10)
+    assert loaded.hex_height == HexLayoutConfig().hex_height
+    assert loaded.offset_mode == "odd-r"
+    assert loaded.dirty is False
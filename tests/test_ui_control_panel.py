@@ -0,0 +1,63 @@
+from game.ui.control_panel import ControlPanel
+
+
+def test_waypoints_stay_tuples_until_the_command_payload() -> None:
+    panel = ControlPanel()
+    panel.append_waypoint((2, 3))
+    panel.append_waypoint((4, 1))
+
+    assert panel.route_waypoints == ((2, 3), (4, 1))
+    assert panel.build_command_payload()["route"] == {"waypoints": ["2,3", "4,1"]}
+
+
+def test_plan_route_parses_string_waypoints() -> None:
+    panel = ControlPanel()
+    panel.plan_route(["0,5", (1, 2)])
+
+    assert panel.route_waypoints == ((0, 5), (1, 2))
+
+
+def test_append_waypoint_parses_string_waypoints() -> None:
+    panel = ControlPanel()
+    panel.append_waypoint("1,2")
+    panel.append_waypoint((3, 4))
+
+    assert panel.route_waypoints == ((1, 2), (3, 4))
+    assert panel.build_command_payload()["route"] == {"waypoints": ["1,2", "3,4"]}
+
+
+def test_render_reuses_the_panel_until_the_plan_changes() -> None:
+    panel = ControlPanel()
+    first = panel.render()
+    assert panel.render() is first
+    assert panel.render(title="Plan") is not first
+
+    panel.append_waypoint((1, 1))
+    second = panel.render()
+    assert second is not first
+
+    panel.assign_crew("Ada", "scout")
+    third = panel.render()
+    assert third is not second
+
+    panel.reset()
+    assert panel.render() is not third
+    assert panel == ControlPanel()
+
+
+def test_command_payload_is_rebuilt_only_after_the_plan_changes() -> None:
+    panel = ControlPanel()
+    panel.set_module_state("tank", "install")
+    first = panel.build_command_payload()
+    first["extra"] = True
+
+    second = panel.build_command_payload()
+    assert "extra" not in second
+    assert second["module_orders"] is first["module_orders"]
+
+    panel.assign_crew("Ada", "scout")
+    third = panel.build_command_payload()
+    assert third["crew_actions"] == [{"action": "scout", "task": "scout", "participants": ["Ada"]}]
+
+    panel.reset()
+    assert panel.build_command_payload() == {}
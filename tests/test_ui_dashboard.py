@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from game.ui.channels import NotificationChannel
+from game.ui.dashboard import DashboardView
+
+
+def test_render_reuses_the_layout_until_stats_or_notifications_change() -> None:
+    channel = NotificationChannel()
+    view = DashboardView(notification_channel=channel)
+    view.update_stats({"Day": "1"})
+
+    first = view.render()
+    assert view.render() is first
+
+    channel.notify(1, "Storm incoming")
+    second = view.render()
+    assert second is not first
+    assert view.render() is second
+
+    view.update_stats({"Day": "2"})
+    assert view.render() is not second
+
+
+def test_site_context_lines_render_one_per_row() -> None:
+    view = DashboardView()
+    view.update_site_context(["Site: Depot", "Mission: escort"])
+    layout = view.render()
+
+    panel = layout["site_context"].renderable
+    assert panel.renderable.plain == "Site: Depot\nMission: escort\n"
+
+
+def test_notifications_section_is_omitted_while_the_channel_is_empty() -> None:
+    channel = NotificationChannel()
+    view = DashboardView(notification_channel=channel)
+    assert channel.is_empty
+    assert [child.name for child in view.render().children] == ["stats"]
+
+    channel.notify(1, "Storm incoming")
+    assert not channel.is_empty
+    assert [child.name for child in view.render().children] == ["stats", "notifications"]
+
+    channel.clear()
+    assert [child.name for child in view.render().children] == ["stats"]
+
+
+def test_stats_panels_are_shared_for_identical_rows() -> None:
+    view = DashboardView()
+    view.update_stats({"Day": "7", "Season": "Spring"})
+    first = view.render()["stats"].renderable
+
+    view.set_focus_detail(None)
+    view.update_stats({"Day": "7", "Season": "Spring"})
+    assert view.render()["stats"].renderable is first
+
+    view.update_stats({"Day": "8", "Season": "Spring"})
+    assert view.render()["stats"].renderable is not first
@@ -45,3 +45,54 @@ def test_diplomacy_view_handles_empty_state() -> None:
     output = _render_widget(view)
 
     assert "No faction data available" in output
+
+
+def test_update_snapshot_precomputes_sorted_edges_and_alliances() -> None:
+    view = DiplomacyView(alliance_threshold=10.0)
+    diplomacy = FactionDiplomacy()
+    diplomacy.set_standing("River Union", "Dune Riders", 12.0)
+    diplomacy.set_standing("Northern Guild", "Dune Riders", -4.0)
+    names = ["Dune Riders", "Northern Guild", "River Union"]
+    ledger = FactionLedger.from_payload([{"name": name} for name in names])
+    factions = {record.name: record for record in ledger.iterate_factions()}
+
+    view.update_snapshot(factions, diplomacy.as_graph(names))
+    snapshot = view._snapshot
+
+    assert list(snapshot.edges) == sorted(snapshot.edges)
+    standings = {frozenset((a, b)): value for a, b, value in snapshot.edges}
+    assert standings[frozenset(("Dune Riders", "River Union"))] == 12.0
+    assert standings[frozenset(("Dune Riders", "Northern Guild"))] == -4.0
+    assert snapshot.alliances == (
+        ("Dune Riders", ("River Union",)),
+        ("River Union", ("Dune Riders",)),
+    )
+    assert "River Union" in _render_widget(view)
+
+
+def test_update_snapshot_keeps_factions_by_reference_unless_copied() -> None:
+    view = DiplomacyView()
+    factions = {
+        record.name: record
+        for record in FactionLedger.from_payload([{"name": "Dune Riders"}]).iterate_factions()
+    }
+
+    view.update_snapshot(factions, None)
+    assert view._snapshot.factions is factions
+
+    view.update_snapshot(factions, None, copy=True)
+    assert view._snapshot.factions is not factions
+    assert view._snapshot.factions == factions
+
+
+def test_placeholder_panels_are_shared_until_the_title_changes() -> None:
+    view = DiplomacyView()
+    view.update_snapshot({}, None)
+
+    first = view.render()
+    assert view.render() is first
+
+    view.title = "Relations"
+    renamed = view.render()
+    assert renamed is not first
+    assert "Relations" in _render_widget(view)
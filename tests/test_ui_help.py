@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from textual.binding import Binding
+
+from game.ui.help import HelpScreen, HelpSection, build_help_commands
+
+
+def test_help_tables_are_built_once_per_section() -> None:
+    commands = build_help_commands(
+        [Binding("q", "quit", "Quit"), Binding("space", "next_turn", "Next Day")]
+    )
+    section = HelpSection("Application", commands)
+    assert isinstance(section.commands, tuple)
+    assert section == HelpSection("Application", list(commands))
+
+    first = HelpScreen([section])
+    second = HelpScreen([HelpSection("Application", commands)])
+
+    assert first._rows is second._rows
+    title, classes, table = first._rows[0]
+    assert title == "Application"
+    assert classes == "help-section-title help-section-title--first"
+    assert table.row_count == 2
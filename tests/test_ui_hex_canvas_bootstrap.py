@@ -6,15 +6,9 @@ from game.ui import config_store
 from game.ui import hex_canvas as ui_hex_canvas
 
 
-def test_hex_canvas_marks_first_run_layout_dirty(tmp_path, monkeypatch):
+def test_hex_canvas_marks_first_run_layout_dirty(layout_config_path):
     """The initial layout adjustment should flag the config as unsaved."""
 
-    config_path = tmp_path / "hex_layout.json"
-
-    # Ensure the UI uses an isolated config path for the test run.
-    monkeypatch.setattr(config_store, "CONFIG_PATH", config_path, raising=False)
-    monkeypatch.setattr(ui_hex_canvas, "CONFIG_PATH", config_path, raising=False)
-
     canvas = ui_hex_canvas.HexCanvas(cols=4, rows=3, radius=6)
 
     posted_messages: list[object] = []
@@ -39,3 +33,26 @@ def test_hex_canvas_marks_first_run_layout_dirty(tmp_path, monkeypatch):
     message_config = getattr(last_message, "config", None)
     assert message_config is cfg
     assert message_config.dirty is True
+
+
+def test_save_layout_skips_the_write_when_nothing_changed(layout_config_path, monkeypatch):
+    canvas = ui_hex_canvas.HexCanvas(cols=4, rows=3, radius=6)
+    posted_messages: list[object] = []
+    canvas.post_message = posted_messages.append  # type: ignore[assignment]
+    canvas.on_mount()
+
+    writes: list[dict[str, object]] = []
+    original_save = config_store.HexLayoutConfig.save
+
+    def _counting_save(self: config_store.HexLayoutConfig) -> None:
+        writes.append(self.to_dict())
+        original_save(self)
+
+    monkeypatch.setattr(config_store.HexLayoutConfig, "save", _counting_save)
+
+    canvas.action_save_layout()
+    canvas.action_save_layout()
+    assert len(writes) == 1
+    assert canvas.cfg is not None and canvas.cfg.dirty is False
+    saved = [m for m in posted_messages if isinstance(m, ui_hex_canvas.HexCanvas.LayoutConfigSaved)]
+    assert len(saved) == 2
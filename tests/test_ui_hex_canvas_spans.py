@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+from textual.geometry import Size
+
+from game.ui import config_store
+from game.ui import hex_canvas as ui_hex_canvas
+from game.ui.hex_canvas import convex_poly_spans, hex_polygon, point_in_convex_poly
+from game.ui.hex_layout import FLAT, POINTY, Layout
+
+
+@pytest.mark.parametrize("orientation", [POINTY, FLAT])
+@pytest.mark.parametrize("size", [(4.0, 2.3), (5.77, 5.0), (11.5, 3.45)])
+def test_spans_match_per_cell_containment(orientation, size) -> None:
+    layout = Layout(orientation=orientation, size_x=size[0], size_y=size[1])
+    for cx, cy in itertools.product((7.3, 12.5, 20.0), (6.1, 9.5, 15.75)):
+        points = hex_polygon(layout, cx, cy)
+        expected = {
+            (x, y)
+            for x, y in itertools.product(range(40), range(30))
+            if point_in_convex_poly(x + 0.5, y + 0.5, points)
+        }
+        filled = {
+            (x, y)
+            for y, start, end in convex_poly_spans(points, 0, 39, 0, 29)
+            for x in range(start, end + 1)
+        }
+        assert filled == expected
+
+
+def test_spans_are_clipped_to_the_bounds() -> None:
+    layout = Layout(orientation=POINTY, size_x=6.0, size_y=5.0)
+    points = hex_polygon(layout, 1.0, 1.0)
+
+    spans = list(convex_poly_spans(points, 0, 3, 0, 2))
+
+    assert [y for y, _, _ in spans] == [0, 1, 2]
+    assert all(0 <= start <= end <= 3 for _, start, end in spans)
+
+
+@pytest.mark.parametrize("orientation", ["pointy", "flat"])
+@pytest.mark.parametrize("offset_mode", ["odd-r", "even-r", "odd-q", "even-q"])
+def test_centre_arrays_match_the_scalar_layout(layout_config_path, orientation, offset_mode):
+    canvas = ui_hex_canvas.HexCanvas(cols=5, rows=4, radius=6)
+    canvas.cfg = config_store.HexLayoutConfig(orientation=orientation, offset_mode=offset_mode)
+    canvas._rebuild_layout()
+    canvas._rebuild_centres()
+    layout = canvas._hex_layout
+    assert layout is not None
+
+    expected = {}
+    for q in range(5):
+        for r in range(4):
+            if orientation == "pointy":
+                parity = (r & 1) if offset_mode in ("odd-r", "even-r") else 0
+                parity ^= offset_mode == "even-r"
+                expected[(q, r)] = layout.hex_to_pixel(q + 0.5 * parity, r)
+            else:
+                parity = (q & 1) if offset_mode in ("odd-q", "even-q") else 0
+                parity ^= offset_mode == "even-q"
+                expected[(q, r)] = layout.hex_to_pixel(q, r + 0.5 * parity)
+
+    assert canvas._centres == expected
+    assert canvas._centre_keys == list(expected)
+    assert canvas._cx.tolist() == [x for x, _ in expected.values()]
+
+
+def test_render_fills_cell_by_cell_on_canvases_without_fill_span(layout_config_path, monkeypatch):
+    class SizedCanvas(ui_hex_canvas.HexCanvas):
+        @property
+        def size(self) -> Size:
+            return Size(60, 30)
+
+    class CellCanvas(ui_hex_canvas.RichCanvas):
+        fill_span = None
+
+    widget = SizedCanvas(cols=4, rows=3, radius=6)
+    monkeypatch.setattr(widget, "post_message", lambda message: message)
+    widget.on_mount()
+    spans = widget.render()
+    monkeypatch.setattr(ui_hex_canvas, "RichCanvas", CellCanvas)
+    cells = widget.render()
+
+    assert isinstance(cells, CellCanvas)
+    assert cells._grid == spans._grid
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from game.world.map import BiomeNoise, BiomeType, HexCoord
+from game.world.rng import WorldRandomness
+
+
+def test_biome_ids_match_per_coordinate_classification() -> None:
+    noise = BiomeNoise(randomness=WorldRandomness(seed=42))
+    q_values = range(-12, 13)
+    r_values = range(-8, 9)
+
+    ids = noise.biome_ids(q_values, r_values)
+
+    assert ids.shape == (len(r_values), len(q_values))
+    for row, r in zip(ids.tolist(), r_values, strict=True):
+        for index, q in zip(row, q_values, strict=True):
+            assert BiomeNoise.BIOME_BANDS[index] is noise.biome(HexCoord(q, r))
+
+
+def test_biome_bands_split_at_the_thresholds(monkeypatch) -> None:
+    noise = BiomeNoise(seed=7)
+    expected = {
+        0.0: BiomeType.WATER,
+        0.0999: BiomeType.WATER,
+        0.1: BiomeType.BARREN,
+        0.35: BiomeType.SCRUBLAND,
+        0.6: BiomeType.FOREST,
+        0.8499: BiomeType.FOREST,
+        0.85: BiomeType.HIGHLAND,
+        1.0: BiomeType.HIGHLAND,
+    }
+    for sample, biome in expected.items():
+        monkeypatch.setattr(noise, "value", lambda coord, sample=sample: sample)
+        assert noise.biome(HexCoord(0, 0)) is biome, sample
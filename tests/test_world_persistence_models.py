@@ -8,6 +8,7 @@ from typing import cast
 import pytest
 
 from game.crew import SkillCheckResult, SkillType
+from game.world import persistence
 from game.world.config import (
     DifficultyLevel,
     WorldConfig,
@@ -16,16 +17,19 @@ from game.world.config import (
 )
 from game.world.map import BiomeType, ChunkCoord, MapChunk, generate_site_network
 from game.world.persistence import (
+    build_save_payload,
     create_world_engine,
     init_world_storage,
     iter_daily_diffs,
     iter_season_snapshots,
     load_daily_diff,
+    load_game_state,
     load_season_snapshot,
     load_world_config,
     store_daily_diff,
     store_season_snapshot,
     store_world_config,
+    write_save_payload,
 )
 from game.world.rng import WorldRandomness
 from game.world.save_models import WorldSnapshot
@@ -295,3 +299,19 @@ def test_negotiation_adjusts_gaussian_parameters() -> None:
     assert after.peak > before.peak
     assert 0.0 <= after.mu <= 100.0
     assert after.sigma <= before.sigma
+
+
+def test_quick_save_payload_is_detached_and_round_trips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(persistence, "_get_save_dir", lambda app_name="": str(tmp_path))
+    missions = [{"faction": "Northern Guild", "expires": 4}]
+    world_state: dict[str, object] = {"missions": missions, "randomness": object()}
+
+    payload = build_save_payload(world_state, faction_controller=None)
+    missions.append({"faction": "Dune Riders", "expires": 6})
+    write_save_payload(payload, slot="quick")
+
+    saved_state, saved_factions = load_game_state(slot="quick")
+    assert saved_state == {"missions": [{"faction": "Northern Guild", "expires": 4}]}
+    assert saved_factions == {}